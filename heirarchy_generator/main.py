@@ -6,24 +6,351 @@ Generates an interactive Treant.js visualization of Rust project structure
 
 import os
 import re
+import sys
+import gzip
+import hashlib
+import hmac
 import json
+import mmap
+import pickle
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Callable, Dict, FrozenSet, List, Set, Optional, Tuple
 from dataclasses import dataclass, field
-from enum import Enum
-
-class NodeType(Enum):
-    FUNCTION    = "function"
-    STRUCT      = "struct"
-    ENUM        = "enum"
-    TRAIT       = "trait"
-    IMPL        = "impl"
-    MODULE      = "module"
-    TYPE_ALIAS  = "type_alias"
-    CONST       = "const"
-    TRAIT_IMPL  = "trait_impl"
+from functools import lru_cache
+from enum import IntEnum
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _source_pattern(pattern: str) -> re.Pattern:
+    """
+    Compile a pattern for matching raw source bytes.
+    Bytes-mode \\w is ASCII only, so it is widened to any non-ASCII byte to keep
+    matching UTF-8 identifiers the way the text patterns did.
+    """
+    compiled = []
+    in_class = False
+    i        = 0
+    
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escape = pattern[i:i + 2]
+            if escape == '\\w':
+                escape = '\\w\\x80-\\xff' if in_class else '[\\w\\x80-\\xff]'
+            compiled.append(escape)
+            i += 2
+            continue
+        if char == '[' and not in_class:
+            in_class = True
+        elif char == ']' and in_class:
+            in_class = False
+        compiled.append(char)
+        i += 1
+    
+    return re.compile(''.join(compiled).encode('ascii'))
+
+# Precompiled patterns shared by every parser pass. Source is scanned as raw
+# bytes and only captured pieces are decoded, so whole-file and body patterns
+# go through _source_pattern while those applied to type strings stay text
+_RE_REF          = re.compile(r'&(mut\s+)?')
+_RE_GENERIC      = re.compile(r'<.*>')
+_RE_CRATE_PREFIX = re.compile(r'^(crate|self|super)::')
+_RE_USE          = _source_pattern(r'use\s+(?:crate::)?([^;]+);')
+_RE_FN_PATH      = re.compile(r'([\w:]+::\w+)')
+_RE_FN_REF       = _source_pattern(r'([\w:]+)::([\w]+)')
+_RE_FN_KEYWORD   = re.compile(rb'\bfn\b')
+_RE_STRUCT       = _source_pattern(r'(pub(?:\([^)]*\))?\s+)?struct\s+(\w+)\s*(?:<[^>]+>)?\s*\{')
+_RE_PARAM_DELIM  = re.compile(r'[<>()\[\],]')
+_RE_ANGLE_DELIM  = re.compile(r'[<>,]')
+_RE_FIELD_TOKEN  = _source_pattern(r'(?P<skip>//[^\n]*|(?s:/\*.*?\*/)|"(?:\\.|[^"\\])*")'
+                                   r'|(?P<word>\w+)|(?P<punct>->|[<>()\[\]{},:])')
+_RE_METHOD       = _source_pattern(r'(pub(?:\([^)]*\))?\s+)?(?:unsafe\s+)?(?:async\s+)?(?:const\s+)?fn\s+(\w+)\s*(?:<[^>]*>)?\s*\(([^)]*)\)\s*(?:->\s*([^{]+))?(?=\s*\{)')
+_RE_ENUM         = _source_pattern(r'(pub(?:\([^)]*\))?\s+)?enum\s+(\w+)\s*(?:<[^>]+>)?\s*\{')
+_RE_VARIANT      = _source_pattern(r'(?s)\s*(?:#\s*\[[^\]]*\]\s*)*(\w+)\s*(?:\((.*?)\)|\{(.*?)\})?\s*(?:=.*)?')
+_RE_VARIANT_DELIM = _source_pattern(r'[()\[\]{},]')
+_RE_TRAIT_IMPL   = _source_pattern(r'impl(?:\s+<[^>]+>)?\s+([\w:]+(?:<[^>]+>)?)\s+for\s+([\w:]+)(?:<[^>]+>)?\s*\{')
+_RE_TRAIT_METHOD = _source_pattern(r'fn\s+(\w+)\s*(?:<[^>]+>)?\s*\(([^)]*)\)\s*(?:->\s*([^{;]+))?')
+_RE_TRAIT        = _source_pattern(r'(pub(?:\([^)]*\))?\s+)?trait\s+(\w+)\s*(?:<[^>]+>)?\s*(?::\s*([^{]+))?\s*\{')
+_RE_FN           = _source_pattern(r'(pub(?:\([^)]*\))?\s+)?fn\s+(\w+)\s*(?:<[^>]+>)?\s*\(([^)]*)\)\s*(?:->\s*([^{;]+))?')
+_RE_CONST        = _source_pattern(r'(pub(?:\([^)]*\))?\s+)?const\s+(\w+)\s*:\s*([^=]+)=')
+_RE_TYPE_ALIAS   = _source_pattern(r'(pub(?:\([^)]*\))?\s+)?type\s+(\w+)\s*(?:<[^>]+>)?\s*=\s*([^;]+);')
+_RE_IMPL_TYPE    = _source_pattern(r'impl(?:\s+<[^>]+>)?\s+(\w+)\s*(?:<[^>]+>)?\s*\{')
+_RE_IMPL_BLOCK   = _source_pattern(r'impl(?:\s+<[^>]+>)?\s+(?:\w+(?:::\w+)*\s+for\s+)?(\w+)\s*(?:<[^>]+>)?\s*\{')
+
+# Definition kinds found by the fused scan. Each starts with its own keyword
+# (optionally after 'pub'), so no two kinds can match at the same offset
+_DEFINITION_PATTERNS = {
+    'use':        _RE_USE,
+    'struct':     _RE_STRUCT,
+    'enum':       _RE_ENUM,
+    'trait':      _RE_TRAIT,
+    'trait_impl': _RE_TRAIT_IMPL,
+    'type_alias': _RE_TYPE_ALIAS,
+    'const':      _RE_CONST,
+}
+_DEFINITION_KEYWORDS = {
+    b'use':    'use',
+    b'struct': 'struct',
+    b'enum':   'enum',
+    b'trait':  'trait',
+    b'impl':   'trait_impl',
+    b'type':   'type_alias',
+    b'const':  'const',
+}
+_RE_DEFINITION      = re.compile(rb'(?=(pub|use|struct|enum|trait|impl|type|const))')
+_RE_PUB_DEFINITION  = re.compile(rb'pub(?:\([^)]*\))?\s+(struct|enum|trait|type|const)')
+
+# Files at least this large are memory mapped instead of read into memory
+_MMAP_MIN_SIZE = 1 << 20
+
+# Buffer size for writing the generated page
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Comments and string/char literals, which are blanked out before parsing
+_RE_NON_CODE = re.compile(rb'//[^\n]*|/\*.*?\*/|\bb?r(#*)".*?"\1|"[^"\\]*(?:\\.[^"\\]*)*"|\'(?:\\.|[^\'\\])\'', re.S)
+
+_RE_BRACE = re.compile(rb'[{}]')
+
+_FIELD_OPENERS = frozenset({b'<', b'(', b'[', b'{'})
+_FIELD_CLOSERS = frozenset({b'>', b')', b']', b'}'})
+_FN_TOKENS     = frozenset({b'fn', b'Fn', b'FnMut', b'FnOnce'})
+
+def _decode(raw: bytes) -> str:
+    """Decode a captured piece of source, tolerating invalid UTF-8"""
+    return raw.decode('utf-8', errors='replace')
+
+def _scan_definitions(content: bytes) -> Dict[str, List[re.Match]]:
+    """
+    Find every definition kind in one pass over the source.
+    Every definition starts at its keyword or at a leading 'pub', so only those
+    offsets are tried; skipping offsets inside a kind's previous match gives
+    the same results as running each pattern's own finditer separately.
+    """
+    definitions = {kind: [] for kind in _DEFINITION_PATTERNS}
+    resume_at   = dict.fromkeys(_DEFINITION_PATTERNS, 0)
+    
+    for hit in _RE_DEFINITION.finditer(content):
+        start   = hit.start()
+        keyword = hit.group(1)
+        if keyword == b'pub':
+            prefixed = _RE_PUB_DEFINITION.match(content, start)
+            if not prefixed:
+                continue
+            keyword = prefixed.group(1)
+        
+        kind = _DEFINITION_KEYWORDS[keyword]
+        if start < resume_at[kind]:
+            continue
+        
+        match = _DEFINITION_PATTERNS[kind].match(content, start)
+        if match:
+            definitions[kind].append(match)
+            resume_at[kind] = match.end()
+    
+    return definitions
 
-@dataclass
+def _blank_non_code(content: bytes) -> bytes:
+    """Overwrite comments and literals with spaces, keeping every offset in place"""
+    return _RE_NON_CODE.sub(lambda match: b' ' * (match.end() - match.start()), content)
+
+def _compute_brace_pairs(content: bytes) -> Dict[int, int]:
+    """Map the offset of every '{' to the offset of its matching '}'"""
+    pairs = {}
+    stack = []
+    
+    # Only brace offsets matter, so let the regex engine skip everything else
+    for match in _RE_BRACE.finditer(content):
+        if match.group() == b'{':
+            stack.append(match.start())
+        elif stack:
+            pairs[stack.pop()] = match.start()
+    
+    return pairs
+
+def _split_top_level_commas(text: str) -> List[str]:
+    """Split on commas outside of <>, () and [], dropping empty parts"""
+    parts = []
+    depth = 0
+    start = 0
+    
+    # Only bracket and comma offsets matter, so jump straight between them
+    for match in _RE_PARAM_DELIM.finditer(text):
+        char = match.group()
+        if char in '<([':
+            depth += 1
+        elif char in '>)]':
+            depth -= 1
+        elif depth == 0:
+            part = text[start:match.start()].strip()
+            if part:
+                parts.append(part)
+            start = match.end()
+    
+    part = text[start:].strip()
+    if part:
+        parts.append(part)
+    
+    return parts
+
+def _split_variants(body: bytes) -> List[bytes]:
+    """Split an enum body on commas outside of (), [] and {}, dropping empty parts"""
+    parts = []
+    depth = 0
+    start = 0
+    
+    # Generic arguments only appear inside a variant's brackets, and a
+    # discriminant like 1 << 3 has unpaired '<', so angle brackets are ignored
+    for match in _RE_VARIANT_DELIM.finditer(body):
+        char = match.group()
+        if char in b'([{':
+            depth += 1
+        elif char in b')]}':
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            part = body[start:match.start()]
+            if part.strip():
+                parts.append(part)
+            start = match.end()
+    
+    part = body[start:]
+    if part.strip():
+        parts.append(part)
+    
+    return parts
+
+@lru_cache(maxsize=8192)
+def _clean_type_name(type_name: str) -> str:
+    """Extract base type name from complex types, preserving module paths"""
+    type_name = type_name.strip()
+    
+    # Plain names like 'usize' or 'Config' have nothing for the patterns to remove
+    if '&' not in type_name and '<' not in type_name and ':' not in type_name:
+        return type_name
+    
+    type_name = _RE_REF.sub('', type_name)
+    type_name = _RE_GENERIC.sub('', type_name)
+    type_name = type_name.strip()
+    
+    # Remove leading 'crate::' or 'self::' or 'super::'
+    type_name = _RE_CRATE_PREFIX.sub('', type_name)
+    
+    return type_name
+
+# Standard library and primitive types, which never become nodes or links
+_STD_TYPES = frozenset({
+    'String', 'Vec', 'Option', 'Result', 'Box', 'Rc', 'Arc',
+    'HashMap', 'HashSet', 'BTreeMap', 'BTreeSet', 'LinkedList',
+    'i8', 'i16', 'i32', 'i64', 'i128', 'isize',
+    'u8', 'u16', 'u32', 'u64', 'u128', 'usize',
+    'f32', 'f64', 'bool', 'char', 'str', '()', 'Self'
+})
+
+@lru_cache(maxsize=8192)
+def _is_std_type(type_name: str) -> bool:
+    """Check whether a type, once cleaned, is a standard library type"""
+    return _clean_type_name(type_name) in _STD_TYPES
+
+@lru_cache(maxsize=8192)
+def _extract_inner_types(type_name: str) -> Tuple[str, ...]:
+    """Extract types from generics like Vec<T>, Option<Result<T, E>>"""
+    # Find the outermost angle brackets
+    start_idx = type_name.find('<')
+    if start_idx == -1:
+        return ()
+    
+    # One frame per open '<': [current argument start, arguments, types nested in
+    # finished arguments, types nested in the current argument]. Only the first
+    # group of each argument is expanded; frames for later ones are None.
+    stack = [[start_idx + 1, [], [], None]]
+    
+    for match in _RE_ANGLE_DELIM.finditer(type_name, start_idx + 1):
+        char  = match.group()
+        frame = stack[-1]
+        
+        if char == '<':
+            if frame is not None and frame[3] is None:
+                frame[3] = []
+                stack.append([match.end(), [], [], None])
+            else:
+                stack.append(None)
+            continue
+        
+        if frame is None:
+            if char == '>':
+                stack.pop()
+            continue
+        
+        # End of an argument, at a comma or the closing bracket
+        arg = type_name[frame[0]:match.start()].strip()
+        if arg:
+            frame[1].append(arg)
+        if frame[3]:
+            frame[2].extend(frame[3])
+        frame[0] = match.end()
+        frame[3] = None
+        
+        if char == '>':
+            stack.pop()
+            types = frame[1] + frame[2]
+            if not stack:
+                return tuple(types)
+            stack[-1][3] = types
+    
+    # The outermost bracket never closed, keep the arguments finished so far
+    frame = stack[0]
+    return tuple(frame[1] + frame[2])
+
+class NodeType(IntEnum):
+    FUNCTION    = 1
+    STRUCT      = 2
+    ENUM        = 3
+    TRAIT       = 4
+    IMPL        = 5
+    MODULE      = 6
+    TYPE_ALIAS  = 7
+    CONST       = 8
+    TRAIT_IMPL  = 9
+    
+    @property
+    def label(self) -> str:
+        """Name used in the output, e.g. 'type_alias'"""
+        return _NODE_TYPE_LABELS[self]
+
+# Output names by node type, so the hot paths skip the enum name lookup
+_NODE_TYPE_LABELS = {node_type: node_type.name.lower() for node_type in NodeType}
+
+# Class strings for every node type and usage, shared by all matching elements
+_NODE_CLASSES = {
+    (node_type, is_used): f"{node_type.label} {'unused' if not is_used else ''}"
+    for node_type in NodeType
+    for is_used in (False, True)
+}
+
+# Node types whose methods also become standalone function nodes
+_METHOD_OWNER_TYPES = frozenset({NodeType.STRUCT, NodeType.ENUM, NodeType.TRAIT})
+
+# Node types whose fields can hold function pointers
+_FIELD_OWNER_TYPES = frozenset({NodeType.STRUCT, NodeType.ENUM})
+
+# Node types that get edges to the types they use
+_USES_EDGE_SOURCES = frozenset({NodeType.STRUCT, NodeType.ENUM, NodeType.TRAIT,
+                                NodeType.TYPE_ALIAS, NodeType.CONST})
+
+# Node types those edges may point at
+_USES_EDGE_TARGETS = frozenset({NodeType.STRUCT, NodeType.ENUM, NodeType.TRAIT, NodeType.TYPE_ALIAS})
+
+# Node types a function gets an edge to from its params and return type
+_FN_USES_TARGETS = frozenset({NodeType.STRUCT, NodeType.ENUM, NodeType.TRAIT})
+
+@dataclass(slots=True)
 class Field:
     name:           str
     type_name:      str
@@ -31,7 +358,7 @@ class Field:
     is_fn_pointer:  bool = False
     fn_pointer_sig: str  = ""
 
-@dataclass
+@dataclass(slots=True)
 class TraitMethod:
     name:        str
     params:      List[Field]
@@ -39,2101 +366,2299 @@ class TraitMethod:
     has_default: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Method:
-    name:        str
-    params:      List[Field]
-    return_type: str
-    is_public:   bool = True
+    name:         str
+    params:       List[Field]
+    return_type:  str
+    is_public:    bool      = True
+    linked_types: List[str] = field(default_factory=list)  # Non-std types in params and return, in order
 
-@dataclass
+@dataclass(slots=True)
 class EnumVariant:
     name:   str
     fields: List[Field]
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     id:            str
     name:          str
     node_type:     NodeType
     file_path:     str
-    is_public:     bool        = True
-    is_used:       bool        = False
-    fields:        List[Field] = field(default_factory=list)
-    methods:       List[Method] = field(default_factory=list)
-    params:        List[Field] = field(default_factory=list)
-    return_type:   str         = ""
+    is_public:     bool              = True
+    is_used:       bool              = False
+    fields:        List[Field]       = field(default_factory=list)
+    methods:       List[Method]      = field(default_factory=list)
+    params:        List[Field]       = field(default_factory=list)
+    return_type:   str               = ""
     variants:      List[EnumVariant] = field(default_factory=list)
-    linked_types:  Set[str]    = field(default_factory=set)
-    full_path:     str         = ""
-    children:      List['Node'] = field(default_factory=list)
+    linked_types:  Set[str]          = field(default_factory=set)
+    full_path:     str               = ""
+    children:      List['Node']      = field(default_factory=list)
     trait_methods: List[TraitMethod] = field(default_factory=list)
-    impl_trait:    str         = "" 
-    impl_for:      str         = ""
-    dependents:    List['Node'] = field(default_factory=list)
-
-class RustParser:
-    def __init__(self, project_root: str):
-        self.project_root = Path(project_root)
-        self.nodes:       Dict[str, Node] = {}
-        self.std_types:   Set[str]        = {
-            'String', 'Vec', 'Option', 'Result', 'Box', 'Rc', 'Arc',
-            'HashMap', 'HashSet', 'BTreeMap', 'BTreeSet', 'LinkedList',
-            'i8', 'i16', 'i32', 'i64', 'i128', 'isize',
-            'u8', 'u16', 'u32', 'u64', 'u128', 'usize',
-            'f32', 'f64', 'bool', 'char', 'str', '()', 'Self'
-        }
-        self.usage_map:   Dict[str, Set[str]] = {}
-        self.use_imports: Dict[str, str]      = {}  # Maps simple name to full path
-
-    def is_std_type(self, type_name: str) -> bool:
-        """Check if a type is from standard library"""
-        clean_type = self._clean_type_name(type_name)
-        return clean_type in self.std_types
-
-    def _clean_type_name(self, type_name: str) -> str:
-        """Extract base type name from complex types, preserving module paths"""
-        type_name = type_name.strip()
-        type_name = re.sub(r'&(mut\s+)?', '', type_name)
-        type_name = re.sub(r'<.*>', '', type_name)
-        type_name = type_name.strip()
-        
-        # Remove leading 'crate::' or 'self::' or 'super::'
-        type_name = re.sub(r'^(crate|self|super)::', '', type_name)
-        
-        return type_name
-
-    def _extract_inner_types(self, type_name: str) -> List[str]:
-        """Extract types from generics like Vec<T>, Option<Result<T, E>>"""
-        types = []
-        
-        # Find the outermost angle brackets
-        start_idx = type_name.find('<')
-        if start_idx == -1:
-            return types
-        
-        # Extract everything inside angle brackets, handling nesting
-        depth   = 0
-        current = ""
-        
-        for i in range(start_idx, len(type_name)):
-            char = type_name[i]
-            
-            if char == '<':
-                if depth > 0:
-                    current += char
-                depth += 1
-            elif char == '>':
-                depth -= 1
-                if depth > 0:
-                    current += char
-                elif depth == 0:
-                    # We've closed the outermost bracket
-                    if current.strip():
-                        types.append(current.strip())
-                    break
-            elif depth > 0:
-                if char == ',' and depth == 1:
-                    # Top-level comma separator
-                    if current.strip():
-                        types.append(current.strip())
-                    current = ""
-                else:
-                    current += char
-        
-        # Recursively extract from nested types
-        nested_types = []
-        for t in types:
-            nested_types.extend(self._extract_inner_types(t))
-        types.extend(nested_types)
-        
-        return types
+    impl_trait:    str               = "" 
+    impl_for:      str               = ""
+    dependents:    List['Node']      = field(default_factory=list)
 
+@dataclass(slots=True)
+class TraitImpl:
+    trait_name: str
+    type_name:  str
+    methods:    List[Method]
 
-    def scan_project(self):
-        """Scan all Rust files in the project, excluding target directory"""
-        rust_files = []
-        
-        for rust_file in self.project_root.rglob("*.rs"):
-            if 'target' in rust_file.parts:
-                continue
-            rust_files.append(rust_file)
-        
-        print(f"Found {len(rust_files)} Rust files (excluding target/)")
-        
-        for rust_file in rust_files:
-            self._parse_file(rust_file)
-        
-        # Create function nodes from methods
-        self._create_method_function_nodes()
-        
-        # Mark usage
-        self._mark_usage()
+@dataclass
+class ParsedFile:
+    file_path:   str
+    module_path: str
+    use_imports: Dict[str, str]  = field(default_factory=dict)
+    type_nodes:  Dict[str, Node] = field(default_factory=dict)  # structs, enums, traits
+    trait_impls: List[TraitImpl] = field(default_factory=list)
+    item_nodes:  Dict[str, Node] = field(default_factory=dict)  # aliases, consts, functions
+
+# Bumped whenever ParsedFile or the parsing rules change, discarding old caches
+_CACHE_VERSION = 11
+
+# Caches live in the user's cache directory, one per project root, so a scan
+# never writes into the project or loads a cache file shipped inside it. Each
+# file is signed with a per-user key, since unpickling it can run code
+_CACHE_DIRNAME  = 'heirarchy_generator'
+_CACHE_KEYNAME  = 'cache.key'
+_CACHE_MAC_SIZE = hashlib.sha256().digest_size
+
+FileStamp  = Tuple[int, int]                     # mtime in ns, size in bytes
+CacheEntry = Tuple[FileStamp, bytes, ParsedFile]  # stamp, content digest, result
+
+# Characters that must not reach the node HTML unescaped
+_HTML_ESCAPE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+def _escape(text: str) -> str:
+    """Escape source-derived text for HTML in a single pass"""
+    return text.translate(_HTML_ESCAPE)
+
+# Fragments of the per-node HTML built by _build_node_html
+_NODE_HEADER_HTML   = ('<div class="node-content"><div class="node-header">'
+                       '<div class="node-type-badge">{type}</div>'
+                       '<div class="node-title">{name}</div></div>')
+_RETURN_TYPE_HTML   = '<div class="return-type-badge"><span class="label">returns</span> {return_type}</div>'
+_SECTION_HTML       = ('<div class="section-wrapper"><div class="section-header">{title}</div>'
+                       '<div class="{list_class}">')
+_SECTION_END_HTML   = '</div></div>'
+_PARAM_HTML         = ('<div class="param-item"><span class="param-name">{name}</span>'
+                       '<span class="param-sep">:</span><span class="param-type">{type_name}</span></div>')
+_FIELD_HTML         = ('<div class="field-item">{vis}{fn_badge}<span class="field-name">{name}</span>'
+                       '<span class="field-sep">:</span><span class="field-type">{type_name}</span></div>')
+_METHOD_HTML        = ('<div class="method-item">{badge}<span class="method-name">fn {name}</span>'
+                       '<span class="method-params">({params})</span>'
+                       '<span class="method-return">{ret}</span></div>')
+_VARIANT_HTML       = '<div class="variant-item"><span class="variant-name">{name}</span></div>'
+_VARIANT_FIELDS_HTML = ('<div class="variant-item"><span class="variant-name">{name}</span>'
+                        '<span class="variant-fields">({fields})</span></div>')
+_DEPENDENT_HTML     = ('<div class="dependent-item"><span class="dep-type-badge {type}">{type}</span>'
+                       '<span class="dependent-name">{name}</span></div>')
+_FILE_INFO_HTML     = '<div class="file-info"><span class="file-icon">📁</span> {file_path}</div></div>'
+_PUB_HTML           = '<span class="visibility">pub</span> '
+_PRIV_HTML          = '<span class="visibility private">priv</span> '
+_FN_POINTER_HTML    = '<span class="fn-pointer-badge">fn ptr</span> '
+_DEFAULT_HTML       = '<span class="default-badge">default</span> '
+
+# Section openers never vary per node, so they are formatted once
+_PARAMS_SECTION_HTML        = _SECTION_HTML.format(title='Parameters',    list_class='params-list')
+_FIELDS_SECTION_HTML        = _SECTION_HTML.format(title='Fields',        list_class='fields-preview')
+_METHODS_SECTION_HTML       = _SECTION_HTML.format(title='Methods',       list_class='methods-preview')
+_TRAIT_METHODS_SECTION_HTML = _SECTION_HTML.format(title='Trait Methods', list_class='methods-preview')
+_VARIANTS_SECTION_HTML      = _SECTION_HTML.format(title='Variants',      list_class='variants-list')
+_DEPENDENTS_SECTION_HTML    = _SECTION_HTML.format(title='Used By',       list_class='dependents-list')
+
+def _join_params(params: List[Field]) -> str:
+    """Render a method's parameters as 'name: Type, ...', most of which have one or none"""
+    if not params:
+        return ''
+    if len(params) == 1:
+        return f'{params[0].name}: {params[0].type_name}'
+    return ', '.join([f'{param.name}: {param.type_name}' for param in params])
+
+def _join_field_types(fields: List[Field]) -> str:
+    """Render a variant's field types as 'Type, ...', most of which have just one"""
+    if len(fields) == 1:
+        return fields[0].type_name
+    return ', '.join([field.type_name for field in fields])
+
+# Cytoscape.js stylesheet; it never changes, so it is built once at import
+_CYTOSCAPE_STYLE = (
+    {
+        'selector': 'node',
+        'style': {
+            'label':            'data(label)',
+            'text-valign':      'center',
+            'text-halign':      'center',
+            'background-color': '#1e293b',
+            'border-width':     2,
+            'border-color':     '#334155',
+            'width':            120,
+            'height':           60,
+            'font-size':        11,
+            'color':            '#f1f5f9',
+            'text-wrap':        'wrap',
+            'text-max-width':   100
+        }
+    },
+    {'selector': 'node.struct',     'style': {'border-color': '#10b981', 'background-color': '#064e3b'}},
+    {'selector': 'node.function',   'style': {'border-color': '#f59e0b', 'background-color': '#78350f', 'shape': 'round-rectangle'}},
+    {'selector': 'node.enum',       'style': {'border-color': '#ef4444', 'background-color': '#7f1d1d'}},
+    {'selector': 'node.trait',      'style': {'border-color': '#8b5cf6', 'background-color': '#5b21b6'}},
+    {'selector': 'node.trait_impl', 'style': {'border-color': '#ec4899', 'background-color': '#831843'}},
+    {'selector': 'node.type_alias', 'style': {'border-color': '#06b6d4', 'background-color': '#155e75'}},
+    {'selector': 'node.const',      'style': {'border-color': '#a3e635', 'background-color': '#3f6212'}},
+    {'selector': 'node.unused',     'style': {'opacity': 0.4}},
+    {
+        'selector': 'node.selected',
+        'style': {
+            'border-width': 4,
+            'border-color': '#60a5fa'
+        }
+    },
+    # Type uses type (struct uses another struct)
+    {
+        'selector': 'edge.edge-uses',
+        'style': {
+            'width':              2,
+            'line-color':         '#60a5fa',
+            'target-arrow-color': '#60a5fa',
+            'target-arrow-shape': 'triangle',
+            'curve-style':        'bezier',
+            'opacity':            0.5
+        }
+    },
+    # Struct/Enum/Trait has method
+    {
+        'selector': 'edge.edge-has-method',
+        'style': {
+            'width':              3,
+            'line-color':         '#10b981',
+            'target-arrow-color': '#10b981',
+            'target-arrow-shape': 'vee',
+            'curve-style':        'bezier',
+            'opacity':            0.8,
+            'line-style':         'solid',
+            'label':              'data(label)',
+            'font-size':          9,
+            'color':              '#10b981',
+            'text-outline-color': '#000000',
+            'text-outline-width': 2
+        }
+    },
+    # Function uses type (in params or return)
+    {
+        'selector': 'edge.edge-fn-uses-type',
+        'style': {
+            'width':              2,
+            'line-color':         '#fbbf24',
+            'target-arrow-color': '#fbbf24',
+            'target-arrow-shape': 'triangle',
+            'curve-style':        'bezier',
+            'opacity':            0.6,
+            'line-style':         'dashed'
+        }
+    },
+    # Function pointer field
+    {
+        'selector': 'edge.edge-fn-pointer',
+        'style': {
+            'width':              3,
+            'line-color':         '#f59e0b',
+            'target-arrow-color': '#f59e0b',
+            'target-arrow-shape': 'diamond',
+            'curve-style':        'bezier',
+            'opacity':            0.9,
+            'line-style':         'dotted',
+            'label':              'data(label)',
+            'font-size':          9,
+            'color':              '#f59e0b',
+            'text-outline-color': '#000000',
+            'text-outline-width': 2
+        }
+    },
+    # Trait impl implements trait
+    {
+        'selector': 'edge.edge-impl-trait',
+        'style': {
+            'width':              3,
+            'line-color':         '#8b5cf6',
+            'target-arrow-color': '#8b5cf6',
+            'target-arrow-shape': 'triangle',
+            'curve-style':        'bezier',
+            'opacity':            0.8,
+            'line-style':         'solid',
+            'label':              'data(label)',
+            'font-size':          9,
+            'color':              '#8b5cf6',
+            'text-outline-color': '#000000',
+            'text-outline-width': 2
+        }
+    },
+    # Type has trait impl
+    {
+        'selector': 'edge.edge-has-trait-impl',
+        'style': {
+            'width':              2,
+            'line-color':         '#ec4899',
+            'target-arrow-color': '#ec4899',
+            'target-arrow-shape': 'vee',
+            'curve-style':        'bezier',
+            'opacity':            0.7,
+            'line-style':         'dashed',
+            'label':              'data(label)',
+            'font-size':          9,
+            'color':              '#ec4899',
+            'text-outline-color': '#000000',
+            'text-outline-width': 2
+        }
+    },
+    {'selector': 'edge:selected', 'style': {'line-color': '#ffffff', 'target-arrow-color': '#ffffff', 'width': 4}}
+)
 
-    def _parse_file(self, file_path: Path):
-        """Parse a single Rust file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
-            return
-        
-        rel_path    = file_path.relative_to(self.project_root)
-        module_path = str(rel_path.with_suffix('')).replace(os.sep, '::')
-        
-        # Parse use statements first
-        self._parse_use_statements(content, module_path)
-        
-        # Parse structs
-        self._parse_structs(content, str(rel_path), module_path)
-        
-        # Parse enums
-        self._parse_enums(content, str(rel_path), module_path)
-        
-        # Parse traits
-        self._parse_traits(content, str(rel_path), module_path)
-        
-        # Parse trait implementations
-        self._parse_trait_impls(content, str(rel_path), module_path)
-        
-        # Parse type aliases
-        self._parse_type_aliases(content, str(rel_path), module_path)
-        
-        # Parse constants
-        self._parse_constants(content, str(rel_path), module_path)
+# Page scaffold around the embedded graph data. These are plain ASCII bytes,
+# so the script's braces are written as-is and nothing is re-encoded
+_INDEX_HTML_HEAD = b'''<!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>Rust Code Hierarchy</title>
+        <link rel="stylesheet" href="styles.css">
+        <script src="https://unpkg.com/cytoscape@3.26.0/dist/cytoscape.min.js"></script>
+        <script src="https://unpkg.com/dagre@0.8.5/dist/dagre.min.js"></script>
+        <script src="https://unpkg.com/cytoscape-dagre@2.5.0/cytoscape-dagre.js"></script>
+        <script src="https://unpkg.com/cytoscape-popper@2.0.0/cytoscape-popper.js"></script>
+        <script src="https://unpkg.com/@popperjs/core@2.11.6/dist/umd/popper.min.js"></script>
+    </head>
+    <body>
+        <div class="container">
+            <h1>Rust Code Hierarchy Visualization</h1>
+            <div class="controls">
+                <button id="btn-fit">Fit to Screen</button>
+                <button id="btn-vertical">Vertical Layout</button>
+                <button id="btn-horizontal">Horizontal Layout</button>
+                <button id="btn-circle">Circle Layout</button>
+            </div>
+            <div id="cy"></div>
+            <div id="tooltip" class="node-tooltip"></div>
+            <div class="legend">
+                <div class="legend-title">Edge Types:</div>
+                <div class="legend-items">
+                    <div class="legend-item">
+                        <div class="legend-line edge-uses-line"></div>
+                        <span>Type uses Type</span>
+                    </div>
+                    <div class="legend-item">
+                        <div class="legend-line edge-has-method-line"></div>
+                        <span>Has Method</span>
+                    </div>
+                    <div class="legend-item">
+                        <div class="legend-line edge-fn-uses-type-line"></div>
+                        <span>Function uses Type</span>
+                    </div>
+                    <div class="legend-item">
+                        <div class="legend-line edge-fn-pointer-line"></div>
+                        <span>Function Pointer Field</span>
+                    </div>
+                    <div class="legend-item">
+                        <div class="legend-line edge-impl-trait-line"></div>
+                        <span>Implements Trait</span>
+                    </div>
+                    <div class="legend-item">
+                        <div class="legend-line edge-has-trait-impl-line"></div>
+                        <span>Has Trait Impl</span>
+                    </div>
+                </div>
+            </div>
+        </div>
         
-        # Parse functions
-        self._parse_functions(content, str(rel_path), module_path)
+        <script>
+            document.addEventListener('DOMContentLoaded', function() {
+                const graphData = '''
 
-    def _parse_use_statements(self, content: str, current_module: str):
-        """Parse use statements to build import map"""
-        use_pattern = r'use\s+(?:crate::)?([^;]+);'
-        
-        for match in re.finditer(use_pattern, content):
-            use_path = match.group(1).strip()
-            
-            # Handle use statements like:
-            # use client::Client;
-            # use client::{Client, Server};
-            # use client::Client as C;
-            
-            # Skip wildcard imports
-            if '*' in use_path:
-                continue
-            
-            # Handle braced imports
-            if '{' in use_path:
-                base_path = use_path.split('{')[0].strip().rstrip('::')
-                items     = use_path.split('{')[1].split('}')[0]
+_INDEX_HTML_TAIL = b''';
                 
-                for item in items.split(','):
-                    item = item.strip()
-                    if not item:
-                        continue
+                if (typeof cytoscape !== 'undefined' && typeof dagre !== 'undefined') {
+                    cytoscape.use(cytoscapeDagre);
+                }
+                
+                const cy = cytoscape({
+                    container:        document.getElementById('cy'),
+                    elements:         graphData.elements,
+                    style:            graphData.style,
+                    layout:           { 
+                        name:     'dagre', 
+                        rankDir:  'TB', 
+                        nodeSep:  50, 
+                        rankSep:  100,
+                        animate:  false
+                    },
+                    wheelSensitivity: 0.2,
+                    minZoom:          0.1,
+                    maxZoom:          3
+                });
+                
+                const tooltip        = document.getElementById('tooltip');
+                let selectedNode     = null;
+                let tooltipPinned    = false;
+                
+                // Show tooltip on hover
+                cy.on('mouseover', 'node', function(evt) {
+                    if (tooltipPinned) return;
                     
-                    # Handle 'as' aliases
-                    if ' as ' in item:
-                        original, alias = item.split(' as ')
-                        simple_name     = alias.strip()
-                        full_path       = f"{base_path}::{original.strip()}"
-                    else:
-                        simple_name = item
-                        full_path   = f"{base_path}::{item}"
+                    const node     = evt.target;
+                    const position = node.renderedPosition();
                     
-                    self.use_imports[simple_name] = full_path
-            else:
-                # Simple import like 'use client::Client;'
-                parts = use_path.split('::')
+                    tooltip.innerHTML = node.data('html');
+                    tooltip.style.display = 'block';
+                    tooltip.style.left    = (position.x + 20) + 'px';
+                    tooltip.style.top     = (position.y - 20) + 'px';
+                });
                 
-                # Handle 'as' aliases
-                if ' as ' in use_path:
-                    path_part, alias = use_path.split(' as ')
-                    simple_name      = alias.strip()
-                    full_path        = path_part.strip()
-                else:
-                    simple_name = parts[-1]
-                    full_path   = use_path
+                // Hide tooltip on mouseout
+                cy.on('mouseout', 'node', function(evt) {
+                    if (tooltipPinned) return;
+                    tooltip.style.display = 'none';
+                });
                 
-                self.use_imports[simple_name] = full_path
-
-    def _resolve_type_path(self, type_name: str) -> List[str]:
-        """
-        Resolve a type name to possible full paths.
-        Returns a list of candidate paths to search for.
-        """
-        candidates = []
-        
-        # If it's already a qualified path like 'client::Client'
-        if '::' in type_name:
-            candidates.append(type_name)
-            # Also try with each segment as the base
-            parts = type_name.split('::')
-            for i in range(len(parts)):
-                candidates.append('::'.join(parts[i:]))
-        else:
-            # Simple type name - check use imports
-            if type_name in self.use_imports:
-                candidates.append(self.use_imports[type_name])
-            
-            # Always add the simple name itself as a candidate
-            candidates.append(type_name)
-        
-        return candidates
+                // Pin tooltip on click
+                cy.on('tap', 'node', function(evt) {
+                    const node     = evt.target;
+                    const position = node.renderedPosition();
+                    
+                    if (selectedNode === node && tooltipPinned) {
+                        // Unpin if clicking the same node
+                        tooltipPinned = false;
+                        tooltip.style.display = 'none';
+                        selectedNode = null;
+                        node.removeClass('selected');
+                    } else {
+                        // Pin to new node
+                        if (selectedNode) {
+                            selectedNode.removeClass('selected');
+                        }
+                        
+                        tooltipPinned = true;
+                        selectedNode  = node;
+                        node.addClass('selected');
+                        
+                        tooltip.innerHTML = node.data('html');
+                        tooltip.style.display = 'block';
+                        tooltip.style.left    = (position.x + 20) + 'px';
+                        tooltip.style.top     = (position.y - 20) + 'px';
+                    }
+                });
+                
+                // Close tooltip when clicking on background
+                cy.on('tap', function(evt) {
+                    if (evt.target === cy) {
+                        tooltipPinned = false;
+                        tooltip.style.display = 'none';
+                        if (selectedNode) {
+                            selectedNode.removeClass('selected');
+                            selectedNode = null;
+                        }
+                    }
+                });
+                
+                // Update tooltip position on pan/zoom
+                cy.on('pan zoom', function() {
+                    if (tooltipPinned && selectedNode) {
+                        const position = selectedNode.renderedPosition();
+                        tooltip.style.left = (position.x + 20) + 'px';
+                        tooltip.style.top  = (position.y - 20) + 'px';
+                    }
+                });
+                
+                document.getElementById('btn-fit').addEventListener('click', function() {
+                    cy.fit();
+                });
+                
+                document.getElementById('btn-vertical').addEventListener('click', function() {
+                    cy.layout({ 
+                        name:              'dagre', 
+                        rankDir:           'TB', 
+                        nodeSep:           50, 
+                        rankSep:           100,
+                        animate:           true,
+                        animationDuration: 500
+                    }).run();
+                });
+                
+                document.getElementById('btn-horizontal').addEventListener('click', function() {
+                    cy.layout({ 
+                        name:              'dagre', 
+                        rankDir:           'LR', 
+                        nodeSep:           50, 
+                        rankSep:           100,
+                        animate:           true,
+                        animationDuration: 500
+                    }).run();
+                });
+                
+                document.getElementById('btn-circle').addEventListener('click', function() {
+                    cy.layout({ 
+                        name:              'circle',
+                        animate:           true,
+                        animationDuration: 500
+                    }).run();
+                });
+                
+                cy.fit();
+            });
+        </script>
+    </body>
+    </html>'''
 
-    def _find_node_by_type(self, type_name: str) -> Optional[Node]:
-        """
-        Find a node by resolving the type name to its full path.
-        Handles both simple names and qualified paths.
-        """
-        candidates = self._resolve_type_path(type_name)
-        
-        for candidate in candidates:
-            # Try exact full path match first
-            for node in self.nodes.values():
-                if node.full_path.endswith(candidate):
-                    return node
-            
-            # Try matching just the name part
-            simple_candidate = candidate.split('::')[-1]
-            for node in self.nodes.values():
-                if node.name == simple_candidate:
-                    # Verify the path is compatible if candidate has path
-                    if '::' in candidate:
-                        path_parts = candidate.split('::')
-                        if len(path_parts) > 1:
-                            # Check if node's path ends with the candidate path
-                            node_parts = node.full_path.split('::')
-                            if len(node_parts) >= len(path_parts):
-                                if node_parts[-len(path_parts):] == path_parts:
-                                    return node
-                    else:
-                        return node
-        
-        return None
+# Stylesheet for the page, kept encoded so it is written without conversion
+_STYLES_CSS = b'''* {
+        margin:     0;
+        padding:    0;
+        box-sizing: border-box;
+    }
 
-    def _extract_fn_references_from_signature(self, signature: str) -> List[str]:
-        """Extract function references from function pointer signatures"""
-        refs = []
+    body {
+        font-family: 'Inter', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        background:  #000000;
+        color:       #e4e4e7;
+        min-height:  100vh;
+        overflow:    hidden;
+    }
 
-        # Pattern for explicit function paths like def_fns::update::default
-        fn_path_pattern = r'([\w:]+::\w+)'
+    .container {
+        width:          100vw;
+        height:         100vh;
+        display:        flex;
+        flex-direction: column;
+        position:       relative;
+    }
 
-        for match in re.finditer(fn_path_pattern, signature):
-            path = match.group(1)
-            # Only add if it looks like a function path (has ::)
-            if '::' in path:
-                refs.append(path)
+    h1 {
+        color:          #60a5fa;
+        padding:        20px;
+        font-size:      1.5rem;
+        font-weight:    700;
+        text-shadow:    0 0 20px rgba(96, 165, 250, 0.3);
+        letter-spacing: -0.5px;
+        background:     rgba(0, 0, 0, 0.5);
+        border-bottom:  1px solid rgba(96, 165, 250, 0.2);
+    }
 
-        return refs
+    .controls {
+        padding:       12px 20px;
+        display:       flex;
+        gap:           12px;
+        background:    rgba(0, 0, 0, 0.5);
+        border-bottom: 1px solid rgba(96, 165, 250, 0.2);
+    }
 
-    def _parse_structs(self, content: str, file_path: str, module_path: str):
-        """Parse struct definitions"""
-        struct_pattern = r'(?:pub\s+)?struct\s+(\w+)\s*(?:<[^>]+>)?\s*\{'
-        
-        for match in re.finditer(struct_pattern, content):
-            struct_name = match.group(1)
-            is_public   = 'pub' in content[max(0, match.start()-10):match.start()]
+    .controls button {
+        background:    linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
+        color:         white;
+        border:        none;
+        padding:       8px 16px;
+        cursor:        pointer;
+        border-radius: 6px;
+        font-size:     13px;
+        font-weight:   600;
+        transition:    all 0.3s ease;
+        box-shadow:    0 2px 4px rgba(0, 0, 0, 0.3);
+    }
 
-            start = match.end()
-            depth = 1
-            end   = start
-
-            for i in range(start, len(content)):
-                if content[i] == '{':
-                    depth += 1
-                elif content[i] == '}':
-                    depth -= 1
-                    if depth == 0:
-                        end = i
-                        break
-            
-            body    = content[start:end]
-            fields  = self._parse_fields(body)
-            node_id = f"{module_path}::{struct_name}"
-            
-            node = Node(
-                id        = node_id,
-                name      = struct_name,
-                node_type = NodeType.STRUCT,
-                file_path = file_path,
-                is_public = is_public,
-                fields    = fields,
-                full_path = node_id
-            )
+    .controls button:hover {
+        background: linear-gradient(135deg, #2563eb 0%, #1d4ed8 100%);
+        transform:  translateY(-1px);
+        box-shadow: 0 4px 8px rgba(59, 130, 246, 0.4);
+    }
 
-            for field in fields:
-                if field.is_fn_pointer:
-                    fn_refs = self._extract_fn_references_from_signature(field.fn_pointer_sig)
-                    for fn_ref in fn_refs:
-                        clean_ref = self._clean_type_name(fn_ref)
-                        if not self.is_std_type(clean_ref):
-                            node.linked_types.add(f"{field.name}::{clean_ref}")
-                else:
-                    clean_type = self._clean_type_name(field.type_name)
-                    if not self.is_std_type(clean_type):
-                        node.linked_types.add(clean_type)
+    #cy {
+        flex:       1;
+        width:      100%;
+        background: radial-gradient(circle at center, #0a0a0a 0%, #000000 100%);
+    }
 
-                    inner_types = self._extract_inner_types(field.type_name)
-                    for inner in inner_types:
-                        clean_inner = self._clean_type_name(inner)
-                        if not self.is_std_type(clean_inner):
-                            node.linked_types.add(clean_inner)
+    /* Tooltip container */
+    .node-tooltip {
+        position:      absolute;
+        display:       none;
+        z-index:       10000;
+        pointer-events: none;
+        max-height:    80vh;
+        overflow-y:    auto;
+    }
 
-            self.nodes[node_id] = node
-            
-            # Parse impl blocks and track function references
-            self._parse_impl_blocks(content, struct_name, node, file_path, module_path)
-            
-            # Track function references in impl blocks
-            self._track_function_references(content, struct_name, node)
-
-    def _parse_fields(self, body: str) -> List[Field]:
-        """Parse struct fields"""
-        fields        = []
-        field_pattern = r'(?:pub\s+)?(\w+)\s*:\s*([^,}]+)'
-
-        for match in re.finditer(field_pattern, body):
-            field_name = match.group(1)
-            type_name  = match.group(2).strip()
-            is_public  = 'pub' in body[max(0, match.start()-10):match.start()]
-
-            is_fn_ptr = False
-            fn_sig    = ""
-
-            if 'fn' in type_name.lower() or 'Fn' in type_name:
-                is_fn_ptr = True
-                fn_sig    = type_name
-
-            fields.append(Field(
-                name           = field_name,
-                type_name      = type_name,
-                is_public      = is_public,
-                is_fn_pointer  = is_fn_ptr,
-                fn_pointer_sig = fn_sig
-            ))
-        
-        return fields
+    .node-content {
+        background:    linear-gradient(145deg, #1e293b 0%, #0f172a 100%);
+        border:        2px solid #334155;
+        border-radius: 12px;
+        padding:       0;
+        min-width:     300px;
+        max-width:     450px;
+        box-shadow:    0 8px 32px rgba(0, 0, 0, 0.8);
+        overflow:      hidden;
+    }
 
-    def _parse_impl_blocks(self, content: str, struct_name: str, node: Node, 
-                          file_path: str, module_path: str):
-        """Parse impl blocks for methods"""
-        impl_pattern = rf'impl(?:\s+<[^>]+>)?\s+{struct_name}\s*(?:<[^>]+>)?\s*\{{'
-        
-        for match in re.finditer(impl_pattern, content):
-            start = match.end()
-            depth = 1
-            end   = start
-            
-            for i in range(start, len(content)):
-                if content[i] == '{':
-                    depth += 1
-                elif content[i] == '}':
-                    depth -= 1
-                    if depth == 0:
-                        end = i
-                        break
-            
-            impl_body = content[start:end]
-            methods   = self._parse_methods(impl_body)
-            
-            node.methods.extend(methods)
-            
-            # Track linked types from methods
-            for method in methods:
-                for param in method.params:
-                    clean_type = self._clean_type_name(param.type_name)
-                    if not self.is_std_type(clean_type):
-                        node.linked_types.add(clean_type)
-                    
-                    inner_types = self._extract_inner_types(param.type_name)
-                    for inner in inner_types:
-                        clean_inner = self._clean_type_name(inner)
-                        if not self.is_std_type(clean_inner):
-                            node.linked_types.add(clean_inner)
-                
-                if method.return_type:
-                    clean_ret = self._clean_type_name(method.return_type)
-                    if not self.is_std_type(clean_ret):
-                        node.linked_types.add(clean_ret)
-                    
-                    inner_types = self._extract_inner_types(method.return_type)
-                    for inner in inner_types:
-                        clean_inner = self._clean_type_name(inner)
-                        if not self.is_std_type(clean_inner):
-                            node.linked_types.add(clean_inner)
+    .node-header {
+        padding:       16px;
+        background:    rgba(0, 0, 0, 0.3);
+        border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+        display:       flex;
+        align-items:   center;
+        gap:           12px;
+    }
 
-    def _track_function_references(self, content: str, struct_name: str, node: Node):
-        """Track function references in impl blocks (e.g., def_fns::update::default)"""
-        impl_pattern = rf'impl(?:\s+<[^>]+>)?\s+{struct_name}\s*(?:<[^>]+>)?\s*\{{'
-        
-        for match in re.finditer(impl_pattern, content):
-            start = match.end()
-            depth = 1
-            end   = start
-            
-            for i in range(start, len(content)):
-                if content[i] == '{':
-                    depth += 1
-                elif content[i] == '}':
-                    depth -= 1
-                    if depth == 0:
-                        end = i
-                        break
-            
-            impl_body = content[start:end]
-            
-            # Look for function path references like def_fns::update::default
-            fn_ref_pattern = r'([\w:]+)::([\w]+)'
-            
-            for fn_match in re.finditer(fn_ref_pattern, impl_body):
-                full_path = fn_match.group(0)
-                parts     = full_path.split('::')
-                
-                # Skip if it's just two parts (might be a type)
-                if len(parts) >= 2:
-                    # Extract the function name (last part)
-                    fn_name = parts[-1]
-                    # The module path is everything except the last part
-                    module  = '::'.join(parts[:-1])
-                    
-                    # Add as a linked type so it gets tracked
-                    node.linked_types.add(full_path)
-                    node.linked_types.add(fn_name)
+    .node-type-badge {
+        background:     rgba(96, 165, 250, 0.2);
+        color:          #60a5fa;
+        padding:        4px 10px;
+        border-radius:  6px;
+        font-size:      10px;
+        font-weight:    700;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+        border:         1px solid rgba(96, 165, 250, 0.3);
+    }
+
+    .node-title {
+        font-size:   18px;
+        font-weight: 700;
+        color:       #f1f5f9;
+        flex:        1;
+    }
+
+    .return-type-badge {
+        background:    rgba(168, 85, 247, 0.15);
+        color:         #a855f7;
+        padding:       8px 12px;
+        border-radius: 6px;
+        font-size:     12px;
+        margin:        12px 16px;
+        display:       inline-block;
+        font-family:   'Courier New', monospace;
+        border:        1px solid rgba(168, 85, 247, 0.3);
+    }
+
+    .return-type-badge .label {
+        opacity:        0.7;
+        font-size:      10px;
+        margin-right:   6px;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+    }
+
+    .section-wrapper {
+        border-bottom: 1px solid rgba(255, 255, 255, 0.05);
+    }
+
+    .section-wrapper:last-of-type {
+        border-bottom: none;
+    }
+
+    .section-header {
+        padding:        12px 16px;
+        background:     rgba(0, 0, 0, 0.2);
+        font-size:      11px;
+        font-weight:    700;
+        text-transform: uppercase;
+        letter-spacing: 1.5px;
+        color:          #94a3b8;
+    }
 
-    def _parse_methods(self, impl_body: str) -> List[Method]:
-        """Parse methods from impl block"""
-        methods = [];
-        # Updated pattern - don't require immediate { or ; after signature
-        # This allows for whitespace and complex bodies
-        method_pattern = r'(?:pub\s+)?(?:unsafe\s+)?(?:async\s+)?(?:const\s+)?fn\s+(\w+)\s*(?:<[^>]*>)?\s*\(([^)]*)\)\s*(?:->\s*([^{]+?))?(?=\s*\{)';
-        
-        for match in re.finditer(method_pattern, impl_body):
-            method_name = match.group(1);
-            params_str  = match.group(2);
-            return_type = match.group(3).strip() if match.group(3) else "";
-            is_public   = 'pub' in impl_body[max(0, match.start()-20):match.start()];
-            
-            params = self._parse_params(params_str);
-            
-            methods.append(Method(
-                name        = method_name,
-                params      = params,
-                return_type = return_type,
-                is_public   = is_public
-            ));
-        
-        return methods;
+    .params-list, .fields-preview, .methods-preview, .variants-list, .dependents-list {
+        padding: 12px 16px;
+    }
 
-    def _parse_params(self, params_str: str) -> List[Field]:
-        """Parse function parameters"""
-        params = []
-        
-        if not params_str.strip():
-            return params
-        
-        # Split by comma but respect nested generics
-        depth       = 0
-        current     = ""
-        param_parts = []
-        
-        for char in params_str:
-            if char in '<([':
-                depth += 1
-            elif char in '>)]':
-                depth -= 1
-            elif char == ',' and depth == 0:
-                if current.strip():
-                    param_parts.append(current.strip())
-                current = ""
-                continue
-            current += char
-        
-        if current.strip():
-            param_parts.append(current.strip())
-        
-        for param in param_parts:
-            param = param.strip()
-            
-            # Skip self parameters
-            if param in ['self', '&self', '&mut self', 'mut self']:
-                continue
-            
-            # Parse "name: type" pattern
-            if ':' in param:
-                parts      = param.split(':', 1)
-                param_name = parts[0].strip()
-                type_name  = parts[1].strip()
-                
-                params.append(Field(
-                    name      = param_name,
-                    type_name = type_name,
-                    is_public = True
-                ))
-        
-        return params
+    .param-item, .field-item, .method-item, .variant-item, .dependent-item {
+        padding:       8px 12px;
+        margin-bottom: 6px;
+        background:    rgba(255, 255, 255, 0.03);
+        border-radius: 6px;
+        font-family:   'Courier New', monospace;
+        font-size:     12px;
+        line-height:   1.6;
+        transition:    all 0.2s ease;
+        border-left:   3px solid transparent;
+    }
 
-    def _parse_enums(self, content: str, file_path: str, module_path: str):
-        """Parse enum definitions"""
-        enum_pattern = r'(?:pub\s+)?enum\s+(\w+)\s*(?:<[^>]+>)?\s*\{'
-        
-        for match in re.finditer(enum_pattern, content):
-            enum_name = match.group(1)
-            is_public = 'pub' in content[max(0, match.start()-10):match.start()]
-            
-            start = match.end()
-            depth = 1
-            end   = start
-            
-            for i in range(start, len(content)):
-                if content[i] == '{':
-                    depth += 1
-                elif content[i] == '}':
-                    depth -= 1
-                    if depth == 0:
-                        end = i
-                        break
-            
-            body     = content[start:end]
-            variants = self._parse_enum_variants(body)
-            node_id  = f"{module_path}::{enum_name}"
-            
-            node = Node(
-                id        = node_id,
-                name      = enum_name,
-                node_type = NodeType.ENUM,
-                file_path = file_path,
-                is_public = is_public,
-                variants  = variants,
-                full_path = node_id
-            )
-            
-            # Track linked types from variants
-            for variant in variants:
-                for field in variant.fields:
-                    clean_type = self._clean_type_name(field.type_name)
-                    if not self.is_std_type(clean_type):
-                        node.linked_types.add(clean_type)
-                    
-                    inner_types = self._extract_inner_types(field.type_name)
-                    for inner in inner_types:
-                        clean_inner = self._clean_type_name(inner)
-                        if not self.is_std_type(clean_inner):
-                            node.linked_types.add(clean_inner)
-            
-            self.nodes[node_id] = node
+    .param-item:hover, .field-item:hover, .method-item:hover, .variant-item:hover, .dependent-item:hover {
+        background:  rgba(255, 255, 255, 0.06);
+        border-left: 3px solid #60a5fa;
+    }
 
-    def _create_method_function_nodes(self):
-        """Create separate function nodes for all methods in structs/enums/traits"""
-        new_nodes = {}
-        
-        for node in list(self.nodes.values()):
-            if node.node_type in [NodeType.STRUCT, NodeType.ENUM, NodeType.TRAIT]:
-                for method in node.methods:
-                    # Create a unique function node for this method
-                    fn_node_id = f"{node.full_path}::fn::{method.name}"
-                    
-                    fn_node = Node(
-                        id          = fn_node_id,
-                        name        = f"{node.name}::{method.name}",
-                        node_type   = NodeType.FUNCTION,
-                        file_path   = node.file_path,
-                        is_public   = method.is_public,
-                        params      = method.params,
-                        return_type = method.return_type,
-                        full_path   = fn_node_id
-                    )
-                    
-                    # Track linked types from method parameters
-                    for param in method.params:
-                        clean_type = self._clean_type_name(param.type_name)
-                        if not self.is_std_type(clean_type):
-                            fn_node.linked_types.add(clean_type)
-                        
-                        inner_types = self._extract_inner_types(param.type_name)
-                        for inner in inner_types:
-                            clean_inner = self._clean_type_name(inner)
-                            if not self.is_std_type(clean_inner):
-                                fn_node.linked_types.add(clean_inner)
-                    
-                    # Track linked types from return type
-                    if method.return_type:
-                        clean_ret = self._clean_type_name(method.return_type)
-                        if not self.is_std_type(clean_ret):
-                            fn_node.linked_types.add(clean_ret)
-                        
-                        inner_types = self._extract_inner_types(method.return_type)
-                        for inner in inner_types:
-                            clean_inner = self._clean_type_name(inner)
-                            if not self.is_std_type(clean_inner):
-                                fn_node.linked_types.add(clean_inner)
-                    
-                    new_nodes[fn_node_id] = fn_node
-        
-        # Add all new function nodes to the main nodes dict
-        self.nodes.update(new_nodes)
+    .param-item:last-child, .field-item:last-child, .method-item:last-child, 
+    .variant-item:last-child, .dependent-item:last-child {
+        margin-bottom: 0;
+    }
 
-    def _parse_trait_impls(self, content: str, file_path: str, module_path: str):
-        """Parse trait implementations (impl Trait for Type)"""
-        impl_pattern = r'impl(?:\s+<[^>]+>)?\s+([\w:]+(?:<[^>]+>)?)\s+for\s+([\w:]+)(?:<[^>]+>)?\s*\{'
-        
-        for match in re.finditer(impl_pattern, content):
-            trait_name = match.group(1).strip();
-            type_name  = match.group(2).strip();
-            
-            start = match.end();
-            depth = 1;
-            end   = start;
-            
-            for i in range(start, len(content)):
-                if content[i] == '{':
-                    depth += 1;
-                elif content[i] == '}':
-                    depth -= 1;
-                    if depth == 0:
-                        end = i;
-                        break;
-            
-            impl_body = content[start:end];
-            methods   = self._parse_methods(impl_body);  # This already parses all methods correctly
-            
-            # Find the target type node and add methods to it
-            target_node = self._find_node_by_type(type_name);
-            if target_node:
-                # Add all methods from trait impl to the target node
-                # Mark that these methods are from a trait impl
-                for method in methods:
-                    method.is_public = True;  # Trait methods are always public
-                target_node.methods.extend(methods);
-                
-                # Track the trait as a linked type
-                clean_trait = self._clean_type_name(trait_name);
-                if not self.is_std_type(clean_trait):
-                    target_node.linked_types.add(clean_trait);
-                    
-                # Track linked types from methods
-                for method in methods:
-                    for param in method.params:
-                        clean_param = self._clean_type_name(param.type_name);
-                        if not self.is_std_type(clean_param):
-                            target_node.linked_types.add(clean_param);
-                        
-                        inner_types = self._extract_inner_types(param.type_name);
-                        for inner in inner_types:
-                            clean_inner = self._clean_type_name(inner);
-                            if not self.is_std_type(clean_inner):
-                                target_node.linked_types.add(clean_inner);
-                    
-                    if method.return_type:
-                        clean_ret = self._clean_type_name(method.return_type);
-                        if not self.is_std_type(clean_ret):
-                            target_node.linked_types.add(clean_ret);
-                        
-                        inner_types = self._extract_inner_types(method.return_type);
-                        for inner in inner_types:
-                            clean_inner = self._clean_type_name(inner);
-                            if not self.is_std_type(clean_inner):
-                                target_node.linked_types.add(clean_inner);
-            else:
-                # Create trait impl node only if target type not found
-                node_id = f"{module_path}::impl_{trait_name}_for_{type_name}";
-                
-                node = Node(
-                    id         = node_id,
-                    name       = f"{trait_name} for {type_name}",
-                    node_type  = NodeType.TRAIT_IMPL,
-                    file_path  = file_path,
-                    is_public  = True,
-                    methods    = methods,
-                    impl_trait = trait_name,
-                    impl_for   = type_name,
-                    full_path  = node_id
-                );
-                
-                # Track linked types...
-                clean_trait = self._clean_type_name(trait_name);
-                clean_type  = self._clean_type_name(type_name);
-                
-                if not self.is_std_type(clean_trait):
-                    node.linked_types.add(clean_trait);
-                if not self.is_std_type(clean_type):
-                    node.linked_types.add(clean_type);
-                
-                # Track linked types from methods
-                for method in methods:
-                    for param in method.params:
-                        clean_param = self._clean_type_name(param.type_name);
-                        if not self.is_std_type(clean_param):
-                            node.linked_types.add(clean_param);
-                        
-                        inner_types = self._extract_inner_types(param.type_name);
-                        for inner in inner_types:
-                            clean_inner = self._clean_type_name(inner);
-                            if not self.is_std_type(clean_inner):
-                                node.linked_types.add(clean_inner);
-                    
-                    if method.return_type:
-                        clean_ret = self._clean_type_name(method.return_type);
-                        if not self.is_std_type(clean_ret):
-                            node.linked_types.add(clean_ret);
-                        
-                        inner_types = self._extract_inner_types(method.return_type);
-                        for inner in inner_types:
-                            clean_inner = self._clean_type_name(inner);
-                            if not self.is_std_type(clean_inner):
-                                node.linked_types.add(clean_inner);
-                
-                self.nodes[node_id] = node;
+    .param-name, .field-name, .method-name, .variant-name, .dependent-name {
+        color:       #38bdf8;
+        font-weight: 600;
+    }
 
+    .param-sep, .field-sep {
+        color:  #64748b;
+        margin: 0 6px;
+    }
 
-    def _parse_trait_methods(self, trait_body: str) -> List[TraitMethod]:
-        """Parse methods from trait definition"""
-        methods        = []
-        method_pattern = r'fn\s+(\w+)\s*(?:<[^>]+>)?\s*\(([^)]*)\)\s*(?:->\s*([^{;]+))?'
-        
-        for match in re.finditer(method_pattern, trait_body):
-            method_name = match.group(1)
-            params_str  = match.group(2)
-            return_type = match.group(3).strip() if match.group(3) else ""
-            
-            # Check if method has default implementation
-            after_sig = trait_body[match.end():].lstrip()
-            has_default = after_sig.startswith('{')
-            
-            params = self._parse_params(params_str)
-            
-            methods.append(TraitMethod(
-                name        = method_name,
-                params      = params,
-                return_type = return_type,
-                has_default = has_default
-            ))
-        
-        return methods
+    .param-type, .field-type {
+        color: #a78bfa;
+    }
 
-    def _parse_traits(self, content: str, file_path: str, module_path: str):
-        """Parse trait definitions"""
-        trait_pattern = r'(?:pub\s+)?trait\s+(\w+)\s*(?:<[^>]+>)?\s*(?::\s*([^{]+))?\s*\{'
-        
-        for match in re.finditer(trait_pattern, content):
-            trait_name = match.group(1)
-            bounds     = match.group(2).strip() if match.group(2) else ""
-            is_public  = 'pub' in content[max(0, match.start()-10):match.start()]
-            
-            start = match.end()
-            depth = 1
-            end   = start
-            
-            for i in range(start, len(content)):
-                if content[i] == '{':
-                    depth += 1
-                elif content[i] == '}':
-                    depth -= 1
-                    if depth == 0:
-                        end = i
-                        break
-            
-            body     = content[start:end]
-            methods  = self._parse_trait_methods(body)
-            node_id  = f"{module_path}::{trait_name}"
-            
-            node = Node(
-                id            = node_id,
-                name          = trait_name,
-                node_type     = NodeType.TRAIT,
-                file_path     = file_path,
-                is_public     = is_public,
-                trait_methods = methods,
-                full_path     = node_id
-            )
-            
-            # Track linked types from trait bounds
-            if bounds:
-                for bound in bounds.split('+'):
-                    clean_bound = self._clean_type_name(bound.strip())
-                    if not self.is_std_type(clean_bound):
-                        node.linked_types.add(clean_bound)
-            
-            # Track linked types from methods
-            for method in methods:
-                for param in method.params:
-                    clean_type = self._clean_type_name(param.type_name)
-                    if not self.is_std_type(clean_type):
-                        node.linked_types.add(clean_type)
-                    
-                    inner_types = self._extract_inner_types(param.type_name)
-                    for inner in inner_types:
-                        clean_inner = self._clean_type_name(inner)
-                        if not self.is_std_type(clean_inner):
-                            node.linked_types.add(clean_inner)
-                
-                if method.return_type:
-                    clean_ret = self._clean_type_name(method.return_type)
-                    if not self.is_std_type(clean_ret):
-                        node.linked_types.add(clean_ret)
-                    
-                    inner_types = self._extract_inner_types(method.return_type)
-                    for inner in inner_types:
-                        clean_inner = self._clean_type_name(inner)
-                        if not self.is_std_type(clean_inner):
-                            node.linked_types.add(clean_inner)
-            
-            self.nodes[node_id] = node
+    .method-params {
+        color:       #94a3b8;
+        margin-left: 4px;
+    }
 
-    def _parse_enum_variants(self, body: str) -> List[EnumVariant]:
-        """Parse enum variants"""
-        variants        = []
-        variant_pattern = r'(\w+)(?:\s*\(([^)]*)\)|\s*\{([^}]*)\})?'
-        
-        for match in re.finditer(variant_pattern, body):
-            variant_name  = match.group(1)
-            tuple_fields  = match.group(2)
-            struct_fields = match.group(3)
-            
-            fields = []
-            
-            if tuple_fields:
-                field_types = [f.strip() for f in tuple_fields.split(',') if f.strip()]
-                for i, type_name in enumerate(field_types):
-                    fields.append(Field(
-                        name      = f"field_{i}",
-                        type_name = type_name,
-                        is_public = True
-                    ))
-            elif struct_fields:
-                fields = self._parse_fields(struct_fields)
-            
-            variants.append(EnumVariant(
-                name   = variant_name,
-                fields = fields
-            ))
-        
-        return variants
+    .method-return {
+        color:       #10b981;
+        margin-left: 8px;
+    }
 
-    def _parse_functions(self, content: str, file_path: str, module_path: str):
-        """Parse standalone functions"""
-        # Remove all impl blocks first to avoid parsing their methods as standalone functions
-        cleaned_content = self._remove_impl_blocks(content)
+    .variant-fields {
+        color:       #94a3b8;
+        margin-left: 4px;
+    }
 
-        fn_pattern = r'(?:pub\s+)?fn\s+(\w+)\s*(?:<[^>]+>)?\s*\(([^)]*)\)\s*(?:->\s*([^{;]+))?'
+    .visibility {
+        background:     rgba(16, 185, 129, 0.2);
+        color:          #10b981;
+        padding:        2px 6px;
+        border-radius:  4px;
+        font-size:      10px;
+        font-weight:    700;
+        margin-right:   8px;
+        text-transform: uppercase;
+    }
 
-        for match in re.finditer(fn_pattern, cleaned_content):
-            fn_name     = match.group(1)
-            params_str  = match.group(2)
-            return_type = match.group(3).strip() if match.group(3) else ""
+    .visibility.private {
+        background: rgba(248, 113, 113, 0.2);
+        color:      #f87171;
+    }
 
-            # Find the corresponding position in the original content
-            original_pos = self._find_in_original(content, match.start(), match.group(0))
-            if original_pos == -1:
-                continue
+    .fn-pointer-badge {
+        background:     rgba(245, 158, 11, 0.2);
+        color:          #f59e0b;
+        padding:        2px 6px;
+        border-radius:  4px;
+        font-size:      9px;
+        font-weight:    700;
+        margin-right:   8px;
+        text-transform: uppercase;
+        border:         1px solid rgba(245, 158, 11, 0.3);
+    }
+
+    .default-badge {
+        background:     rgba(139, 92, 246, 0.2);
+        color:          #8b5cf6;
+        padding:        2px 6px;
+        border-radius:  4px;
+        font-size:      9px;
+        font-weight:    700;
+        margin-right:   8px;
+        text-transform: uppercase;
+        border:         1px solid rgba(139, 92, 246, 0.3);
+    }
 
-            is_public = 'pub' in content[max(0, original_pos-10):original_pos]
+    .dep-type-badge {
+        background:     rgba(236, 72, 153, 0.2);
+        color:          #ec4899;
+        padding:        2px 6px;
+        border-radius:  4px;
+        font-size:      9px;
+        font-weight:    700;
+        text-transform: uppercase;
+        border:         1px solid rgba(236, 72, 153, 0.3);
+        margin-right:   8px;
+    }
 
-            params  = self._parse_params(params_str)
-            node_id = f"{module_path}::{fn_name}"
+    .dep-type-badge.struct   { background: rgba(16, 185, 129, 0.2); color: #10b981; border: 1px solid rgba(16, 185, 129, 0.3); }
+    .dep-type-badge.function { background: rgba(245, 158, 11, 0.2); color: #f59e0b; border: 1px solid rgba(245, 158, 11, 0.3); }
+    .dep-type-badge.enum     { background: rgba(239, 68, 68, 0.2);  color: #ef4444; border: 1px solid rgba(239, 68, 68, 0.3); }
+    .dep-type-badge.trait    { background: rgba(139, 92, 246, 0.2); color: #8b5cf6; border: 1px solid rgba(139, 92, 246, 0.3); }
 
-            node = Node(
-                id          = node_id,
-                name        = fn_name,
-                node_type   = NodeType.FUNCTION,
-                file_path   = file_path,
-                is_public   = is_public,
-                params      = params,
-                return_type = return_type,
-                full_path   = node_id
-            )
+    .file-info {
+        padding:     12px 16px;
+        background:  rgba(0, 0, 0, 0.3);
+        font-size:   11px;
+        color:       #64748b;
+        font-style:  italic;
+        display:     flex;
+        align-items: center;
+        gap:         8px;
+    }
 
-            # Track linked types
-            for param in params:
-                clean_type = self._clean_type_name(param.type_name)
-                if not self.is_std_type(clean_type):
-                    node.linked_types.add(clean_type)
+    .file-icon {
+        font-size: 14px;
+    }
 
-                inner_types = self._extract_inner_types(param.type_name)
-                for inner in inner_types:
-                    clean_inner = self._clean_type_name(inner)
-                    if not self.is_std_type(clean_inner):
-                        node.linked_types.add(clean_inner)
+    .dependent-item.more {
+        opacity:    0.6;
+        font-style: italic;
+        color:      #94a3b8;
+    }
 
-            if return_type:
-                clean_ret = self._clean_type_name(return_type)
-                if not self.is_std_type(clean_ret):
-                    node.linked_types.add(clean_ret)
+    /* Scrollbar for tooltip */
+    .node-tooltip::-webkit-scrollbar {
+        width: 8px;
+    }
 
-                inner_types = self._extract_inner_types(return_type)
-                for inner in inner_types:
-                    clean_inner = self._clean_type_name(inner)
-                    if not self.is_std_type(clean_inner):
-                        node.linked_types.add(clean_inner)
+    .node-tooltip::-webkit-scrollbar-track {
+        background:    rgba(0, 0, 0, 0.3);
+        border-radius: 4px;
+    }
 
-            self.nodes[node_id] = node
+    .node-tooltip::-webkit-scrollbar-thumb {
+        background:    rgba(96, 165, 250, 0.3);
+        border-radius: 4px;
+    }
 
-    def _parse_constants(self, content: str, file_path: str, module_path: str):
-        """Parse constants"""
-        const_pattern = r'(?:pub\s+)?const\s+(\w+)\s*:\s*([^=]+)='
-        
-        for match in re.finditer(const_pattern, content):
-            const_name = match.group(1)
-            const_type = match.group(2).strip()
-            is_public  = 'pub' in content[max(0, match.start()-10):match.start()]
-            node_id    = f"{module_path}::{const_name}"
-            
-            node = Node(
-                id          = node_id,
-                name        = const_name,
-                node_type   = NodeType.CONST,
-                file_path   = file_path,
-                is_public   = is_public,
-                return_type = const_type,  # Store type in return_type field
-                full_path   = node_id
-            )
-            
-            # Track the const type
-            clean_type = self._clean_type_name(const_type)
-            if not self.is_std_type(clean_type):
-                node.linked_types.add(clean_type)
-            
-            inner_types = self._extract_inner_types(const_type)
-            for inner in inner_types:
-                clean_inner = self._clean_type_name(inner)
-                if not self.is_std_type(clean_inner):
-                    node.linked_types.add(clean_inner)
-            
-            self.nodes[node_id] = node
+    .node-tooltip::-webkit-scrollbar-thumb:hover {
+        background: rgba(96, 165, 250, 0.5);
+    }
 
-    def _parse_type_aliases(self, content: str, file_path: str, module_path: str):
-        """Parse type aliases"""
-        type_pattern = r'(?:pub\s+)?type\s+(\w+)\s*(?:<[^>]+>)?\s*=\s*([^;]+);'
-        
-        for match in re.finditer(type_pattern, content):
-            alias_name = match.group(1)
-            target_type = match.group(2).strip()
-            is_public   = 'pub' in content[max(0, match.start()-10):match.start()]
-            node_id     = f"{module_path}::{alias_name}"
-            
-            node = Node(
-                id          = node_id,
-                name        = alias_name,
-                node_type   = NodeType.TYPE_ALIAS,
-                file_path   = file_path,
-                is_public   = is_public,
-                return_type = target_type,  # Store target type in return_type field
-                full_path   = node_id
-            )
-            
-            # Track the target type
-            clean_target = self._clean_type_name(target_type)
-            if not self.is_std_type(clean_target):
-                node.linked_types.add(clean_target)
-            
-            inner_types = self._extract_inner_types(target_type)
-            for inner in inner_types:
-                clean_inner = self._clean_type_name(inner)
-                if not self.is_std_type(clean_inner):
-                    node.linked_types.add(clean_inner)
-            
-            self.nodes[node_id] = node
+    .legend {
+        padding:       12px 20px;
+        background:    rgba(0, 0, 0, 0.5);
+        border-bottom: 1px solid rgba(96, 165, 250, 0.2);
+        display:       flex;
+        align-items:   center;
+        gap:           20px;
+    }
 
-    def _remove_impl_blocks(self, content: str) -> str:
-        """Remove all impl blocks from content to avoid parsing their methods"""
-        impl_pattern = r'impl(?:\s+<[^>]+>)?\s+(?:\w+(?:::\w+)*\s+for\s+)?(\w+)\s*(?:<[^>]+>)?\s*\{'
-        
-        result = []
-        last_end = 0
-        
-        for match in re.finditer(impl_pattern, content):
-            # Add content before this impl block
-            result.append(content[last_end:match.start()])
-            
-            # Skip the impl block
-            start = match.end()
-            depth = 1
-            
-            for i in range(start, len(content)):
-                if content[i] == '{':
-                    depth += 1
-                elif content[i] == '}':
-                    depth -= 1
-                    if depth == 0:
-                        last_end = i + 1
-                        break
-        
-        # Add remaining content
-        result.append(content[last_end:])
-        return ''.join(result)
-    
-    def _find_in_original(self, original: str, approx_pos: int, pattern: str) -> int:
-        """Find the position of a pattern in the original content near an approximate position"""
-        # Search within a reasonable range
-        search_start = max(0, approx_pos - 100)
-        search_end = min(len(original), approx_pos + 100)
-        
-        idx = original.find(pattern, search_start, search_end)
-        return idx
+    .legend-title {
+        font-size:   12px;
+        font-weight: 700;
+        color:       #94a3b8;
+    }
 
-    def _mark_usage(self):
-        """Mark which nodes are used by others"""
-        # Mark all public items as potentially used (they might be called from outside)
-        for node in self.nodes.values():
-            if node.is_public:
-                node.is_used = True;
-        
-        # Mark items that are referenced internally
-        for node in self.nodes.values():
-            for linked_type in node.linked_types:
-                target_node = self._find_node_by_type(linked_type);
-                if target_node:
-                    target_node.is_used = True;
+    .legend-items {
+        display:    flex;
+        gap:        16px;
+        flex-wrap:  wrap;
+    }
 
-    def _build_tree_structure(self) -> List[Dict]:
-        """Build tree structure with parent-child relationships using resolved paths"""
-        # First pass: build children relationships
-        for node in self.nodes.values():
-            for linked_type in node.linked_types:
-                target_node = self._find_node_by_type(linked_type)
-                if target_node and target_node not in node.children:
-                    node.children.append(target_node)
-                    # Also track reverse relationship (dependents)
-                    if node not in target_node.dependents:
-                        target_node.dependents.append(node)
-        
-        # Find root nodes (nodes not used as children)
-        all_children = set()
-        for node in self.nodes.values():
-            for child in node.children:
-                all_children.add(child.id)
-        
-        root_nodes = [node for node in self.nodes.values() if node.id not in all_children]
-        
-        return root_nodes
+    .legend-item {
+        display:     flex;
+        align-items: center;
+        gap:         8px;
+        font-size:   11px;
+        color:       #cbd5e1;
+    }
 
-    def generate_output(self, output_dir: str = "output"):
-        """Generate visualization files"""
-        output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True)
-        
-        # Build graph data
-        graph_data = self._build_graph_data()
-        
-        # Generate HTML with embedded data
-        self._generate_html(output_path, graph_data)
-        
-        # Generate CSS
-        self._generate_css(output_path)
-        
-        print(f"\nVisualization generated in '{output_dir}/' directory")
-        print(f"Open '{output_dir}/index.html' in your browser")
+    .legend-line {
+        width:  30px;
+        height: 3px;
+    }
 
-    def _build_graph_data(self) -> Dict:
-        """Build data structure for Cytoscape.js graph"""
-        elements    = []
-        added_nodes = set()
-        added_edges = set()
-        
-        # Add all nodes
-        for node in self.nodes.values():
-            if node.id in added_nodes:
-                continue
-            
-            added_nodes.add(node.id)
-            html_parts = self._build_node_html(node)
-            
-            elements.append({
-                'data': {
-                    'id':        node.id,
-                    'label':     node.name,
-                    'type':      node.node_type.value,
-                    'is_used':   node.is_used,
-                    'html':      ''.join(html_parts),
-                    'file_path': node.file_path
-                },
-                'classes': f"{node.node_type.value} {'unused' if not node.is_used else ''}"
-            })
-        
-        # Add edges for type dependencies (struct/enum/trait -> other types they use)
-        for node in self.nodes.values():
-            if node.node_type in [NodeType.STRUCT, NodeType.ENUM, NodeType.TRAIT, NodeType.TYPE_ALIAS, NodeType.CONST]:
-                for linked_type in node.linked_types:
-                    target_node = self._find_node_by_type(linked_type)
-                    if target_node and target_node.node_type in [NodeType.STRUCT, NodeType.ENUM, NodeType.TRAIT, NodeType.TYPE_ALIAS]:
-                        edge_id = f"{node.id}-uses->{target_node.id}"
-                        if edge_id not in added_edges:
-                            added_edges.add(edge_id)
-                            elements.append({
-                                'data': {
-                                    'id':        edge_id,
-                                    'source':    node.id,
-                                    'target':    target_node.id,
-                                    'edgeType':  'uses'
-                                },
-                                'classes': 'edge-uses'
-                            })
-        
-        # Add edges for method implementations (struct/enum/trait -> method functions)
-        for node in self.nodes.values():
-            if node.node_type in [NodeType.STRUCT, NodeType.ENUM, NodeType.TRAIT]:
-                for method in node.methods:
-                    # Find the corresponding function node we created
-                    fn_node_id = f"{node.full_path}::fn::{method.name}"
-                    if fn_node_id in self.nodes:
-                        edge_id = f"{node.id}-has_method->{fn_node_id}"
-                        if edge_id not in added_edges:
-                            added_edges.add(edge_id)
-                            elements.append({
-                                'data': {
-                                    'id':        edge_id,
-                                    'source':    node.id,
-                                    'target':    fn_node_id,
-                                    'edgeType':  'has_method',
-                                    'label':     'method'
-                                },
-                                'classes': 'edge-has-method'
-                            })
-        
-        # Add edges from functions to types they use (function params/returns -> types)
-        for node in self.nodes.values():
-            if node.node_type == NodeType.FUNCTION:
-                for linked_type in node.linked_types:
-                    target_node = self._find_node_by_type(linked_type)
-                    if target_node and target_node.node_type in [NodeType.STRUCT, NodeType.ENUM, NodeType.TRAIT]:
-                        edge_id = f"{node.id}-uses->{target_node.id}"
-                        if edge_id not in added_edges:
-                            added_edges.add(edge_id)
-                            elements.append({
-                                'data': {
-                                    'id':        edge_id,
-                                    'source':    node.id,
-                                    'target':    target_node.id,
-                                    'edgeType':  'fn_uses_type'
-                                },
-                                'classes': 'edge-fn-uses-type'
-                            })
+    .edge-uses-line            { background: #60a5fa; }
+    .edge-has-method-line      { background: #10b981; }
+    .edge-fn-uses-type-line    { 
+        background:    transparent;
+        border-top:    2px dashed #fbbf24;
+        border-bottom: none;
+        height:        0;
+    }
+    .edge-fn-pointer-line      { 
+        background:    transparent;
+        border-top:    2px dotted #f59e0b;
+        border-bottom: none;
+        height:        0;
+    }
+    .edge-impl-trait-line      { background: #8b5cf6; }
+    .edge-has-trait-impl-line  { 
+        background:    transparent;
+        border-top:    2px dashed #ec4899;
+        border-bottom: none;
+        height:        0;
+    }
+    '''
+
+class RustParser:
+    def __init__(self, project_root: str, jobs: Optional[int] = None, use_cache: bool = True):
+        self.project_root = Path(project_root)
+        self.jobs         = jobs  # None uses every core, 1 parses in-process
+        self.use_cache    = use_cache
+        self.nodes:       Dict[str, Node] = {}
+        self.std_types:   FrozenSet[str]  = _STD_TYPES
+        self.usage_map:   Dict[str, Set[str]] = {}
+        self.use_imports: Dict[str, str]      = {}  # Maps simple name to full path
         
-        # Add edges for function pointers in struct fields
-        for node in self.nodes.values():
-            if node.node_type in [NodeType.STRUCT, NodeType.ENUM]:
-                for field in node.fields:
-                    if field.is_fn_pointer:
-                        # Extract function references from the signature
-                        fn_refs = self._extract_fn_references_from_signature(field.fn_pointer_sig)
-                        for fn_ref in fn_refs:
-                            fn_node = self._find_node_by_type(fn_ref)
-                            if fn_node and fn_node.node_type == NodeType.FUNCTION:
-                                edge_id = f"{node.id}-fn_ptr:{field.name}->{fn_node.id}"
-                                if edge_id not in added_edges:
-                                    added_edges.add(edge_id)
-                                    elements.append({
-                                        'data': {
-                                            'id':        edge_id,
-                                            'source':    node.id,
-                                            'target':    fn_node.id,
-                                            'edgeType':  'fn_pointer',
-                                            'label':     f'fn_ptr: {field.name}'
-                                        },
-                                        'classes': 'edge-fn-pointer'
-                                    })
+        # Node ids and types in first-insertion order, for passes that filter
+        # on type alone, and each id's position in them; maintained by _register
+        self._node_ids:   List[str]      = []
+        self._node_types: List[NodeType] = []
+        self._node_index: Dict[str, int] = {}
         
-        # Add edges for trait implementations
-        for node in self.nodes.values():
-            if node.node_type == NodeType.TRAIT_IMPL:
-                # Connect trait impl to the trait
-                if node.impl_trait:
-                    trait_node = self._find_node_by_type(node.impl_trait)
-                    if trait_node:
-                        edge_id = f"{node.id}-impl_trait->{trait_node.id}"
-                        if edge_id not in added_edges:
-                            added_edges.add(edge_id)
-                            elements.append({
-                                'data': {
-                                    'id':        edge_id,
-                                    'source':    node.id,
-                                    'target':    trait_node.id,
-                                    'edgeType':  'impl_trait',
-                                    'label':     'implements'
-                                },
-                                'classes': 'edge-impl-trait'
-                            })
-                
-                # Connect type to trait impl
-                if node.impl_for:
-                    type_node = self._find_node_by_type(node.impl_for)
-                    if type_node:
-                        edge_id = f"{type_node.id}-has_impl->{node.id}"
-                        if edge_id not in added_edges:
-                            added_edges.add(edge_id)
-                            elements.append({
-                                'data': {
-                                    'id':        edge_id,
-                                    'source':    type_node.id,
-                                    'target':    node.id,
-                                    'edgeType':  'has_trait_impl',
-                                    'label':     'impl for'
-                                },
-                                'classes': 'edge-has-trait-impl'
-                            })
+        # Lookup indexes for _find_node_by_type, maintained by _register
+        self._by_name:        Dict[str, List[str]] = {}  # Node name to ids
+        self._by_path_suffix: Dict[str, List[str]] = {}  # Suffix of a path's last segment to ids
         
-        return {
-            'elements': elements,
-            'style':    self._build_cytoscape_style()
-        }
+        # Results of _find_node_by_type, dropped whenever nodes or imports change
+        self._resolved_types: Dict[str, Optional[Node]] = {}
 
-    def _find_method_function(self, parent_node: Node, method: Method) -> Optional[Node]:
-        """
-        Try to find a standalone function node that might correspond to this method.
-        This is a heuristic - looks for functions with matching names in related modules.
-        """
-        # Look for functions with matching name
-        method_path = f"{parent_node.full_path.rsplit('::', 1)[0]}::{method.name}"
+    def is_std_type(self, type_name: str) -> bool:
+        """Check if a type is from standard library"""
+        return _is_std_type(type_name)
+
+    def type_counts(self) -> Counter:
+        """Count the project's nodes by type label"""
+        # Every node's type is kept in a column of its own, so the counts come
+        # from one C-level pass without visiting the node objects
+        counts = Counter(self._node_types)
+        return Counter({_NODE_TYPE_LABELS[node_type]: count for node_type, count in counts.items()})
+
+    def scan_project(self):
+        """Scan all Rust files in the project, excluding target directory"""
+        rust_files = _find_rust_files(self.project_root)
         
-        for node in self.nodes.values():
-            if node.node_type == NodeType.FUNCTION:
-                if node.full_path == method_path or node.name == method.name:
-                    # Verify signature similarity
-                    if len(node.params) == len(method.params):
-                        return node
+        print(f"Found {len(rust_files)} Rust files (excluding target/)")
+        
+        # Files removed or renamed since the walk have no stamp and are skipped
+        found      = rust_files
+        rust_files = []
+        stamps     = []
+        for f in found:
+            stamp = self._file_stamp(f)
+            if stamp is not None:
+                rust_files.append(f)
+                stamps.append(stamp)
+        
+        cache      = self._load_cache() if self.use_cache else {}
+        paths      = [str(f.resolve()) for f in rust_files]
+        hits       = [self._cached_entry(cache.get(path), f, stamp)
+                      for path, f, stamp in zip(paths, rust_files, stamps)]
+        parsed_all = [entry[2] if entry else None for entry in hits]
+        stale      = [f for f, parsed in zip(rust_files, parsed_all) if parsed is None]
+        
+        # Files are parsed independently, in worker processes when allowed
+        if self.jobs == 1 or len(stale) < 2:
+            fresh = map(_parse_file_worker, stale, repeat(self.project_root))
+        else:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                fresh = list(executor.map(_parse_file_worker, stale,
+                                          repeat(self.project_root), chunksize=16))
+        
+        fresh = iter(fresh)
+        parsed_all = [next(fresh) if parsed is None else parsed for parsed in parsed_all]
+        
+        # Save before merging, which mutates the nodes the cache refers to
+        if self.use_cache:
+            entries = {}
+            for path, f, stamp, entry, parsed in zip(paths, rust_files, stamps, hits, parsed_all):
+                if parsed is None:
+                    continue
+                digest = entry[1] if entry else _file_digest(f)
+                if digest is not None:
+                    entries[path] = (stamp, digest, parsed)
+            self._save_cache(entries)
+        
+        # Merge back in discovery order
+        for parsed in parsed_all:
+            self._merge_parsed_file(parsed)
+        
+        # Create function nodes from methods
+        self._create_method_function_nodes()
         
+        # Mark usage
+        self._mark_usage()
+
+    def _file_stamp(self, file_path: Path) -> Optional[FileStamp]:
+        """Cheaply fingerprint a file by its modification time and size, or None if it's gone"""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _cached_entry(self, entry: Optional[CacheEntry], file_path: Path,
+                      stamp: FileStamp) -> Optional[CacheEntry]:
+        """Reuse a cache entry if the file is unchanged, rehashing only when its mtime moved"""
+        # Entries only come from a cache file whose signature _load_cache
+        # verified, so the stored digest is one an earlier run computed here.
+        # Anything not shaped like an entry is treated as a miss
+        if not (isinstance(entry, tuple) and len(entry) == 3):
+            return None
+        
+        cached_stamp, digest, parsed = entry
+        if not (isinstance(cached_stamp, tuple) and isinstance(digest, bytes)
+                and isinstance(parsed, ParsedFile)):
+            return None
+        
+        if cached_stamp == stamp:
+            return entry
+        
+        # Checkouts and touches change mtime without changing contents
+        if cached_stamp[1] == stamp[1] and _file_digest(file_path) == digest:
+            return entry
         return None
 
-    def _build_node_html(self, node: Node) -> List[str]:
-        """Build HTML content for a node (extracted for reuse)"""
-        html_parts = [
-            '<div class="node-content">',
-            '<div class="node-header">',
-            f'<div class="node-type-badge">{node.node_type.value}</div>',
-            f'<div class="node-title">{node.name}</div>',
-            '</div>'
-        ]
+    def _cache_path(self) -> Path:
+        """Cache file for this project, named by a hash of its resolved root"""
+        root_hash = hashlib.sha256(str(self.project_root.resolve()).encode('utf-8')).hexdigest()
+        return _cache_dir() / f"{root_hash[:32]}.pkl"
+
+    def _load_cache(self) -> Dict[str, CacheEntry]:
+        """Load parse results saved by a previous run, or nothing if unusable"""
+        try:
+            key  = _cache_key()
+            data = self._cache_path().read_bytes()
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            print(f"Ignoring unreadable parse cache: {e}")
+            return {}
+        
+        # Only unpickle what this user's own runs signed
+        mac, payload = data[:_CACHE_MAC_SIZE], data[_CACHE_MAC_SIZE:]
+        if not hmac.compare_digest(mac, hmac.digest(key, payload, 'sha256')):
+            print("Ignoring parse cache that fails its integrity check")
+            return {}
         
-        if node.return_type:
-            html_parts.append(
-                f'<div class="return-type-badge">'
-                f'<span class="label">returns</span> {node.return_type}'
-                f'</div>'
-            )
+        try:
+            version, entries = pickle.loads(payload)
+        except Exception as e:
+            print(f"Ignoring unreadable parse cache: {e}")
+            return {}
         
-        # Parameters
-        if node.params:
-            html_parts.extend([
-                '<div class="section-wrapper">',
-                '<div class="section-header">Parameters</div>',
-                '<div class="params-list">'
-            ])
-            for param in node.params:
-                html_parts.append(
-                    f'<div class="param-item">'
-                    f'<span class="param-name">{param.name}</span>'
-                    f'<span class="param-sep">:</span>'
-                    f'<span class="param-type">{param.type_name}</span>'
-                    f'</div>'
-                )
-            html_parts.append('</div></div>')
+        return entries if version == _CACHE_VERSION else {}
+
+    def _save_cache(self, entries: Dict[str, CacheEntry]):
+        """Persist parse results for the files seen in this run"""
+        try:
+            cache_path = self._cache_path()
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            
+            payload = pickle.dumps((_CACHE_VERSION, entries), protocol=pickle.HIGHEST_PROTOCOL)
+            mac     = hmac.digest(_cache_key(create=True), payload, 'sha256')
+            
+            # Replace the old cache in one step so concurrent runs never read half a file
+            temp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(temp_path, 'wb') as f:
+                f.write(mac)
+                f.write(payload)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            print(f"Error writing parse cache: {e}")
+
+    def _parse_file(self, file_path: Path) -> Optional[ParsedFile]:
+        """Parse a single Rust file into a ParsedFile, leaving self.nodes empty"""
+        try:
+            with open(file_path, 'rb') as f:
+                # Mapping only pays off over copying for large files
+                if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+                    content = f.read()
+                else:
+                    content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}")
+            return None
         
-        # Fields
-        if node.fields:
-            html_parts.extend([
-                '<div class="section-wrapper">',
-                '<div class="section-header">Fields</div>',
-                '<div class="fields-preview">'
-            ])
-            for field in node.fields:
-                vis      = '<span class="visibility">pub</span> ' if field.is_public else '<span class="visibility private">priv</span> '
-                fn_badge = '<span class="fn-pointer-badge">fn ptr</span> ' if field.is_fn_pointer else ''
-                html_parts.append(
-                    f'<div class="field-item">'
-                    f'{vis}{fn_badge}'
-                    f'<span class="field-name">{field.name}</span>'
-                    f'<span class="field-sep">:</span>'
-                    f'<span class="field-type">{field.type_name}</span>'
-                    f'</div>'
-                )
-            html_parts.append('</div></div>')
+        if isinstance(content, mmap.mmap):
+            with content:
+                return self._parse_content(file_path, content)
+        return self._parse_content(file_path, content)
+
+    def _parse_content(self, file_path: Path, content: bytes) -> ParsedFile:
+        """Parse the source of one Rust file, read as bytes or memory mapped"""
+        rel_path    = file_path.relative_to(self.project_root)
+        module_path = str(rel_path.with_suffix('')).replace(os.sep, '::')
+        parsed      = ParsedFile(file_path=str(rel_path), module_path=module_path)
         
-        # Methods
-        if node.methods:
-            html_parts.extend([
-                '<div class="section-wrapper">',
-                '<div class="section-header">Methods</div>',
-                '<div class="methods-preview">'
-            ])
-            for method in node.methods:
-                vis        = '<span class="visibility">pub</span> ' if method.is_public else '<span class="visibility private">priv</span> '
-                param_list = ', '.join([f'{p.name}: {p.type_name}' for p in method.params])
-                ret        = f' → {method.return_type}' if method.return_type else ''
-                html_parts.append(
-                    f'<div class="method-item">'
-                    f'{vis}'
-                    f'<span class="method-name">fn {method.name}</span>'
-                    f'<span class="method-params">({param_list})</span>'
-                    f'<span class="method-return">{ret}</span>'
-                    f'</div>'
-                )
-            html_parts.append('</div></div>')
+        # Keywords and braces in comments, doc examples and strings aren't code
+        content = _blank_non_code(content)
         
-        # Trait methods
-        if node.trait_methods:
-            html_parts.extend([
-                '<div class="section-wrapper">',
-                '<div class="section-header">Trait Methods</div>',
-                '<div class="methods-preview">'
-            ])
-            for method in node.trait_methods:
-                param_list = ', '.join([f'{p.name}: {p.type_name}' for p in method.params])
-                ret        = f' → {method.return_type}' if method.return_type else ''
-                default    = '<span class="default-badge">default</span> ' if method.has_default else ''
-                html_parts.append(
-                    f'<div class="method-item">'
-                    f'{default}'
-                    f'<span class="method-name">fn {method.name}</span>'
-                    f'<span class="method-params">({param_list})</span>'
-                    f'<span class="method-return">{ret}</span>'
-                    f'</div>'
-                )
-            html_parts.append('</div></div>')
+        # Find every struct, enum, trait, impl, alias, const and use at once
+        definitions = _scan_definitions(content)
         
-        # Variants
-        if node.variants:
-            html_parts.extend([
-                '<div class="section-wrapper">',
-                '<div class="section-header">Variants</div>',
-                '<div class="variants-list">'
-            ])
-            for variant in node.variants:
-                if variant.fields:
-                    field_list = ', '.join([f.type_name for f in variant.fields])
-                    html_parts.append(
-                        f'<div class="variant-item">'
-                        f'<span class="variant-name">{variant.name}</span>'
-                        f'<span class="variant-fields">({field_list})</span>'
-                        f'</div>'
-                    )
-                else:
-                    html_parts.append(f'<div class="variant-item"><span class="variant-name">{variant.name}</span></div>')
-            html_parts.append('</div></div>')
+        # Parse use statements first
+        self._parse_use_statements(definitions, module_path)
         
-        # Dependents
-        if node.dependents:
-            html_parts.extend([
-                '<div class="section-wrapper">',
-                '<div class="section-header">Used By</div>',
-                '<div class="dependents-list">'
-            ])
-            for dependent in node.dependents[:10]:
-                dep_type_badge = f'<span class="dep-type-badge {dependent.node_type.value}">{dependent.node_type.value}</span>'
-                html_parts.append(
-                    f'<div class="dependent-item">'
-                    f'{dep_type_badge}'
-                    f'<span class="dependent-name">{dependent.name}</span>'
-                    f'</div>'
-                )
-            if len(node.dependents) > 10:
-                html_parts.append(f'<div class="dependent-item more">+ {len(node.dependents) - 10} more...</div>')
-            html_parts.append('</div></div>')
+        # Files holding only use and mod lines (lib.rs, mod.rs re-exports)
+        # have no bodies to slice, so brace pairing and the item passes are skipped
+        if not _RE_FN_KEYWORD.search(content) and not any(
+                matches for kind, matches in definitions.items() if kind != 'use'):
+            parsed.use_imports = self.use_imports
+            return parsed
         
-        html_parts.append(f'<div class="file-info"><span class="file-icon">📁</span> {node.file_path}</div>')
-        html_parts.append('</div>')
+        # Pair every brace once so definition bodies can be sliced directly
+        brace_pairs = _compute_brace_pairs(content)
         
-        return html_parts
-
-    def _build_cytoscape_style(self) -> List[Dict]:
-        """Build Cytoscape.js style configuration"""
-        return [
-            {
-                'selector': 'node',
-                'style': {
-                    'label':            'data(label)',
-                    'text-valign':      'center',
-                    'text-halign':      'center',
-                    'background-color': '#1e293b',
-                    'border-width':     2,
-                    'border-color':     '#334155',
-                    'width':            120,
-                    'height':           60,
-                    'font-size':        11,
-                    'color':            '#f1f5f9',
-                    'text-wrap':        'wrap',
-                    'text-max-width':   100
-                }
-            },
-            {'selector': 'node.struct',     'style': {'border-color': '#10b981', 'background-color': '#064e3b'}},
-            {'selector': 'node.function',   'style': {'border-color': '#f59e0b', 'background-color': '#78350f', 'shape': 'round-rectangle'}},
-            {'selector': 'node.enum',       'style': {'border-color': '#ef4444', 'background-color': '#7f1d1d'}},
-            {'selector': 'node.trait',      'style': {'border-color': '#8b5cf6', 'background-color': '#5b21b6'}},
-            {'selector': 'node.trait_impl', 'style': {'border-color': '#ec4899', 'background-color': '#831843'}},
-            {'selector': 'node.type_alias', 'style': {'border-color': '#06b6d4', 'background-color': '#155e75'}},
-            {'selector': 'node.const',      'style': {'border-color': '#a3e635', 'background-color': '#3f6212'}},
-            {'selector': 'node.unused',     'style': {'opacity': 0.4}},
-            {
-                'selector': 'node.selected',
-                'style': {
-                    'border-width': 4,
-                    'border-color': '#60a5fa'
-                }
-            },
-            # Type uses type (struct uses another struct)
-            {
-                'selector': 'edge.edge-uses',
-                'style': {
-                    'width':              2,
-                    'line-color':         '#60a5fa',
-                    'target-arrow-color': '#60a5fa',
-                    'target-arrow-shape': 'triangle',
-                    'curve-style':        'bezier',
-                    'opacity':            0.5
-                }
-            },
-            # Struct/Enum/Trait has method
-            {
-                'selector': 'edge.edge-has-method',
-                'style': {
-                    'width':              3,
-                    'line-color':         '#10b981',
-                    'target-arrow-color': '#10b981',
-                    'target-arrow-shape': 'vee',
-                    'curve-style':        'bezier',
-                    'opacity':            0.8,
-                    'line-style':         'solid',
-                    'label':              'data(label)',
-                    'font-size':          9,
-                    'color':              '#10b981',
-                    'text-outline-color': '#000000',
-                    'text-outline-width': 2
-                }
-            },
-            # Function uses type (in params or return)
-            {
-                'selector': 'edge.edge-fn-uses-type',
-                'style': {
-                    'width':              2,
-                    'line-color':         '#fbbf24',
-                    'target-arrow-color': '#fbbf24',
-                    'target-arrow-shape': 'triangle',
-                    'curve-style':        'bezier',
-                    'opacity':            0.6,
-                    'line-style':         'dashed'
-                }
-            },
-            # Function pointer field
-            {
-                'selector': 'edge.edge-fn-pointer',
-                'style': {
-                    'width':              3,
-                    'line-color':         '#f59e0b',
-                    'target-arrow-color': '#f59e0b',
-                    'target-arrow-shape': 'diamond',
-                    'curve-style':        'bezier',
-                    'opacity':            0.9,
-                    'line-style':         'dotted',
-                    'label':              'data(label)',
-                    'font-size':          9,
-                    'color':              '#f59e0b',
-                    'text-outline-color': '#000000',
-                    'text-outline-width': 2
-                }
-            },
-            # Trait impl implements trait
-            {
-                'selector': 'edge.edge-impl-trait',
-                'style': {
-                    'width':              3,
-                    'line-color':         '#8b5cf6',
-                    'target-arrow-color': '#8b5cf6',
-                    'target-arrow-shape': 'triangle',
-                    'curve-style':        'bezier',
-                    'opacity':            0.8,
-                    'line-style':         'solid',
-                    'label':              'data(label)',
-                    'font-size':          9,
-                    'color':              '#8b5cf6',
-                    'text-outline-color': '#000000',
-                    'text-outline-width': 2
-                }
-            },
-            # Type has trait impl
-            {
-                'selector': 'edge.edge-has-trait-impl',
-                'style': {
-                    'width':              2,
-                    'line-color':         '#ec4899',
-                    'target-arrow-color': '#ec4899',
-                    'target-arrow-shape': 'vee',
-                    'curve-style':        'bezier',
-                    'opacity':            0.7,
-                    'line-style':         'dashed',
-                    'label':              'data(label)',
-                    'font-size':          9,
-                    'color':              '#ec4899',
-                    'text-outline-color': '#000000',
-                    'text-outline-width': 2
-                }
-            },
-            {'selector': 'edge:selected', 'style': {'line-color': '#ffffff', 'target-arrow-color': '#ffffff', 'width': 4}}
-        ]
-
-    def _generate_html(self, output_path: Path, graph_data: Dict):
-        """Generate HTML file with Cytoscape.js visualization"""
-        graph_json = json.dumps(graph_data, indent=2)
+        # Index inherent impl blocks once so structs can look theirs up
+        impl_index = self._index_impl_blocks(content, brace_pairs)
         
-        html_content = f'''<!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Rust Code Hierarchy</title>
-        <link rel="stylesheet" href="styles.css">
-        <script src="https://unpkg.com/cytoscape@3.26.0/dist/cytoscape.min.js"></script>
-        <script src="https://unpkg.com/dagre@0.8.5/dist/dagre.min.js"></script>
-        <script src="https://unpkg.com/cytoscape-dagre@2.5.0/cytoscape-dagre.js"></script>
-        <script src="https://unpkg.com/cytoscape-popper@2.0.0/cytoscape-popper.js"></script>
-        <script src="https://unpkg.com/@popperjs/core@2.11.6/dist/umd/popper.min.js"></script>
-    </head>
-    <body>
-        <div class="container">
-            <h1>Rust Code Hierarchy Visualization</h1>
-            <div class="controls">
-                <button id="btn-fit">Fit to Screen</button>
-                <button id="btn-vertical">Vertical Layout</button>
-                <button id="btn-horizontal">Horizontal Layout</button>
-                <button id="btn-circle">Circle Layout</button>
-            </div>
-            <div id="cy"></div>
-            <div id="tooltip" class="node-tooltip"></div>
-            <div class="legend">
-                <div class="legend-title">Edge Types:</div>
-                <div class="legend-items">
-                    <div class="legend-item">
-                        <div class="legend-line edge-uses-line"></div>
-                        <span>Type uses Type</span>
-                    </div>
-                    <div class="legend-item">
-                        <div class="legend-line edge-has-method-line"></div>
-                        <span>Has Method</span>
-                    </div>
-                    <div class="legend-item">
-                        <div class="legend-line edge-fn-uses-type-line"></div>
-                        <span>Function uses Type</span>
-                    </div>
-                    <div class="legend-item">
-                        <div class="legend-line edge-fn-pointer-line"></div>
-                        <span>Function Pointer Field</span>
-                    </div>
-                    <div class="legend-item">
-                        <div class="legend-line edge-impl-trait-line"></div>
-                        <span>Implements Trait</span>
-                    </div>
-                    <div class="legend-item">
-                        <div class="legend-line edge-has-trait-impl-line"></div>
-                        <span>Has Trait Impl</span>
-                    </div>
-                </div>
-            </div>
-        </div>
+        # Parse structs
+        self._parse_structs(content, definitions, str(rel_path), module_path, brace_pairs, impl_index)
         
-        <script>
-            document.addEventListener('DOMContentLoaded', function() {{
-                const graphData = {graph_json};
-                
-                if (typeof cytoscape !== 'undefined' && typeof dagre !== 'undefined') {{
-                    cytoscape.use(cytoscapeDagre);
-                }}
-                
-                const cy = cytoscape({{
-                    container:        document.getElementById('cy'),
-                    elements:         graphData.elements,
-                    style:            graphData.style,
-                    layout:           {{ 
-                        name:     'dagre', 
-                        rankDir:  'TB', 
-                        nodeSep:  50, 
-                        rankSep:  100,
-                        animate:  false
-                    }},
-                    wheelSensitivity: 0.2,
-                    minZoom:          0.1,
-                    maxZoom:          3
-                }});
-                
-                const tooltip        = document.getElementById('tooltip');
-                let selectedNode     = null;
-                let tooltipPinned    = false;
+        # Parse enums
+        self._parse_enums(content, definitions, str(rel_path), module_path, brace_pairs)
+        
+        # Parse traits
+        self._parse_traits(content, definitions, str(rel_path), module_path, brace_pairs)
+        
+        # Trait impls resolve against every node parsed so far, including
+        # other files, so they are handed back and resolved while merging
+        parsed.type_nodes, self.nodes = self.nodes, {}
+        parsed.trait_impls = self._parse_trait_impls(content, definitions, brace_pairs)
+        
+        # Parse type aliases
+        self._parse_type_aliases(content, definitions, str(rel_path), module_path)
+        
+        # Parse constants
+        self._parse_constants(content, definitions, str(rel_path), module_path)
+        
+        # Parse functions
+        self._parse_functions(content, str(rel_path), module_path, brace_pairs)
+        
+        parsed.item_nodes, self.nodes = self.nodes, {}
+        parsed.use_imports = self.use_imports
+        
+        return parsed
+
+    def _merge_parsed_file(self, parsed: Optional[ParsedFile]):
+        """Fold one file's results into the project, in the order they were parsed"""
+        if parsed is None:
+            return
+        
+        self.use_imports.update(parsed.use_imports)
+        self._resolved_types.clear()
+        
+        for node in parsed.type_nodes.values():
+            self._register(node)
+        
+        for trait_impl in parsed.trait_impls:
+            self._resolve_trait_impl(trait_impl, parsed.file_path, parsed.module_path)
+        
+        for node in parsed.item_nodes.values():
+            self._register(node)
+
+    def _register(self, node: Node):
+        """Add a node to the project, indexing ids seen for the first time"""
+        # Index lists keep first-insertion order, matching self.nodes iteration
+        # Names arrive as fresh copies from each worker; interning makes equal
+        # names across the project share one string object. Linked types are
+        # interned where they are collected, so their sets are never rebuilt
+        node.name         = sys.intern(node.name)
+        node.full_path    = sys.intern(node.full_path)
+        self._resolved_types.clear()
+        
+        position = self._node_index.get(node.id)
+        if position is not None:
+            self._node_types[position] = node.node_type
+        else:
+            self._node_index[node.id] = len(self._node_ids)
+            self._node_ids.append(node.id)
+            self._node_types.append(node.node_type)
+            self._by_name.setdefault(node.name, []).append(node.id)
+            
+            last_segment = node.full_path.split('::')[-1]
+            for i in range(len(last_segment)):
+                self._by_path_suffix.setdefault(last_segment[i:], []).append(node.id)
+        
+        self.nodes[node.id] = node
+
+    def _parse_use_statements(self, definitions: Dict[str, List[re.Match]], current_module: str):
+        """Parse use statements to build import map"""
+        for match in definitions['use']:
+            use_path = _decode(match.group(1)).strip()
+            
+            # Handle use statements like:
+            # use client::Client;
+            # use client::{Client, Server};
+            # use client::Client as C;
+            
+            # Skip wildcard imports
+            if '*' in use_path:
+                continue
+            
+            # Handle braced imports
+            if '{' in use_path:
+                base_path = use_path.split('{')[0].strip().rstrip('::')
+                items     = use_path.split('{')[1].split('}')[0]
                 
-                // Show tooltip on hover
-                cy.on('mouseover', 'node', function(evt) {{
-                    if (tooltipPinned) return;
-                    
-                    const node     = evt.target;
-                    const position = node.renderedPosition();
+                for item in items.split(','):
+                    item = item.strip()
+                    if not item:
+                        continue
                     
-                    tooltip.innerHTML = node.data('html');
-                    tooltip.style.display = 'block';
-                    tooltip.style.left    = (position.x + 20) + 'px';
-                    tooltip.style.top     = (position.y - 20) + 'px';
-                }});
-                
-                // Hide tooltip on mouseout
-                cy.on('mouseout', 'node', function(evt) {{
-                    if (tooltipPinned) return;
-                    tooltip.style.display = 'none';
-                }});
-                
-                // Pin tooltip on click
-                cy.on('tap', 'node', function(evt) {{
-                    const node     = evt.target;
-                    const position = node.renderedPosition();
+                    # Handle 'as' aliases
+                    if ' as ' in item:
+                        original, alias = item.split(' as ')
+                        simple_name     = alias.strip()
+                        full_path       = f"{base_path}::{original.strip()}"
+                    else:
+                        simple_name = item
+                        full_path   = f"{base_path}::{item}"
                     
-                    if (selectedNode === node && tooltipPinned) {{
-                        // Unpin if clicking the same node
-                        tooltipPinned = false;
-                        tooltip.style.display = 'none';
-                        selectedNode = null;
-                        node.removeClass('selected');
-                    }} else {{
-                        // Pin to new node
-                        if (selectedNode) {{
-                            selectedNode.removeClass('selected');
-                        }}
-                        
-                        tooltipPinned = true;
-                        selectedNode  = node;
-                        node.addClass('selected');
-                        
-                        tooltip.innerHTML = node.data('html');
-                        tooltip.style.display = 'block';
-                        tooltip.style.left    = (position.x + 20) + 'px';
-                        tooltip.style.top     = (position.y - 20) + 'px';
-                    }}
-                }});
-                
-                // Close tooltip when clicking on background
-                cy.on('tap', function(evt) {{
-                    if (evt.target === cy) {{
-                        tooltipPinned = false;
-                        tooltip.style.display = 'none';
-                        if (selectedNode) {{
-                            selectedNode.removeClass('selected');
-                            selectedNode = null;
-                        }}
-                    }}
-                }});
-                
-                // Update tooltip position on pan/zoom
-                cy.on('pan zoom', function() {{
-                    if (tooltipPinned && selectedNode) {{
-                        const position = selectedNode.renderedPosition();
-                        tooltip.style.left = (position.x + 20) + 'px';
-                        tooltip.style.top  = (position.y - 20) + 'px';
-                    }}
-                }});
-                
-                document.getElementById('btn-fit').addEventListener('click', function() {{
-                    cy.fit();
-                }});
-                
-                document.getElementById('btn-vertical').addEventListener('click', function() {{
-                    cy.layout({{ 
-                        name:              'dagre', 
-                        rankDir:           'TB', 
-                        nodeSep:           50, 
-                        rankSep:           100,
-                        animate:           true,
-                        animationDuration: 500
-                    }}).run();
-                }});
-                
-                document.getElementById('btn-horizontal').addEventListener('click', function() {{
-                    cy.layout({{ 
-                        name:              'dagre', 
-                        rankDir:           'LR', 
-                        nodeSep:           50, 
-                        rankSep:           100,
-                        animate:           true,
-                        animationDuration: 500
-                    }}).run();
-                }});
+                    self.use_imports[simple_name] = full_path
+            else:
+                # Simple import like 'use client::Client;'
+                parts = use_path.split('::')
                 
-                document.getElementById('btn-circle').addEventListener('click', function() {{
-                    cy.layout({{ 
-                        name:              'circle',
-                        animate:           true,
-                        animationDuration: 500
-                    }}).run();
-                }});
+                # Handle 'as' aliases
+                if ' as ' in use_path:
+                    path_part, alias = use_path.split(' as ')
+                    simple_name      = alias.strip()
+                    full_path        = path_part.strip()
+                else:
+                    simple_name = parts[-1]
+                    full_path   = use_path
                 
-                cy.fit();
-            }});
-        </script>
-    </body>
-    </html>'''
-        
-        with open(output_path / "index.html", 'w') as f:
-            f.write(html_content)
+                self.use_imports[simple_name] = full_path
 
-    def _generate_css(self, output_path: Path):
-        """Generate CSS file"""
-        css_content = '''* {
-        margin:     0;
-        padding:    0;
-        box-sizing: border-box;
-    }
+    def _resolve_type_path(self, type_name: str) -> List[str]:
+        """
+        Resolve a type name to possible full paths.
+        Returns a list of candidate paths to search for.
+        """
+        candidates = []
+        
+        # If it's already a qualified path like 'client::Client'
+        if '::' in type_name:
+            candidates.append(type_name)
+            # Also try with each segment as the base
+            parts = type_name.split('::')
+            for i in range(len(parts)):
+                candidates.append('::'.join(parts[i:]))
+        else:
+            # Simple type name - check use imports
+            if type_name in self.use_imports:
+                candidates.append(self.use_imports[type_name])
+            
+            # Always add the simple name itself as a candidate
+            candidates.append(type_name)
+        
+        return candidates
 
-    body {
-        font-family: 'Inter', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        background:  #000000;
-        color:       #e4e4e7;
-        min-height:  100vh;
-        overflow:    hidden;
-    }
+    def _find_node_by_type(self, type_name: str) -> Optional[Node]:
+        """
+        Find a node by resolving the type name to its full path.
+        Handles both simple names and qualified paths.
+        """
+        # Usage marking and every edge pass look up the same names again
+        if type_name in self._resolved_types:
+            return self._resolved_types[type_name]
+        
+        node = self._lookup_node_by_type(type_name)
+        self._resolved_types[type_name] = node
+        return node
 
-    .container {
-        width:          100vw;
-        height:         100vh;
-        display:        flex;
-        flex-direction: column;
-        position:       relative;
-    }
+    def _lookup_node_by_type(self, type_name: str) -> Optional[Node]:
+        """Resolve a type name against the current nodes and imports"""
+        candidates = self._resolve_type_path(type_name)
+        
+        for candidate in candidates:
+            simple_candidate = candidate.split('::')[-1]
+            
+            # Any path ending with the candidate has a last segment ending with
+            # its simple name, so the indexes narrow both passes down. An empty
+            # or colon-led simple name can match anywhere and is scanned in full
+            if simple_candidate and simple_candidate[0] != ':':
+                path_matches = self._by_path_suffix.get(simple_candidate, ())
+                name_matches = self._by_name.get(simple_candidate, ())
+            else:
+                path_matches = name_matches = self.nodes.keys()
+            
+            # Try exact full path match first
+            for node_id in path_matches:
+                node = self.nodes[node_id]
+                if node.full_path.endswith(candidate):
+                    return node
+            
+            # Try matching just the name part
+            for node_id in name_matches:
+                node = self.nodes[node_id]
+                if node.name == simple_candidate:
+                    # Verify the path is compatible if candidate has path
+                    if '::' in candidate:
+                        path_parts = candidate.split('::')
+                        if len(path_parts) > 1:
+                            # Check if node's path ends with the candidate path
+                            node_parts = node.full_path.split('::')
+                            if len(node_parts) >= len(path_parts):
+                                if node_parts[-len(path_parts):] == path_parts:
+                                    return node
+                    else:
+                        return node
+        
+        return None
 
-    h1 {
-        color:          #60a5fa;
-        padding:        20px;
-        font-size:      1.5rem;
-        font-weight:    700;
-        text-shadow:    0 0 20px rgba(96, 165, 250, 0.3);
-        letter-spacing: -0.5px;
-        background:     rgba(0, 0, 0, 0.5);
-        border-bottom:  1px solid rgba(96, 165, 250, 0.2);
-    }
+    def _extract_fn_references_from_signature(self, signature: str) -> List[str]:
+        """Extract function references from function pointer signatures"""
+        refs = []
 
-    .controls {
-        padding:       12px 20px;
-        display:       flex;
-        gap:           12px;
-        background:    rgba(0, 0, 0, 0.5);
-        border-bottom: 1px solid rgba(96, 165, 250, 0.2);
-    }
+        # Explicit function paths like def_fns::update::default
+        for match in _RE_FN_PATH.finditer(signature):
+            path = match.group(1)
+            # Only add if it looks like a function path (has ::)
+            if '::' in path:
+                refs.append(path)
 
-    .controls button {
-        background:    linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
-        color:         white;
-        border:        none;
-        padding:       8px 16px;
-        cursor:        pointer;
-        border-radius: 6px;
-        font-size:     13px;
-        font-weight:   600;
-        transition:    all 0.3s ease;
-        box-shadow:    0 2px 4px rgba(0, 0, 0, 0.3);
-    }
+        return refs
 
-    .controls button:hover {
-        background: linear-gradient(135deg, #2563eb 0%, #1d4ed8 100%);
-        transform:  translateY(-1px);
-        box-shadow: 0 4px 8px rgba(59, 130, 246, 0.4);
-    }
+    def _parse_structs(self, content: bytes, definitions: Dict[str, List[re.Match]],
+                       file_path: str, module_path: str,
+                       brace_pairs: Dict[int, int],
+                       impl_index: Dict[str, List[Tuple[int, int]]]):
+        """Parse struct definitions"""
+        id_prefix = module_path + '::'
+        
+        for match in definitions['struct']:
+            struct_name = _decode(match.group(2))
+            is_public   = match.group(1) is not None
 
-    #cy {
-        flex:       1;
-        width:      100%;
-        background: radial-gradient(circle at center, #0a0a0a 0%, #000000 100%);
-    }
+            start = match.end()
+            end   = brace_pairs.get(start - 1, start)
+            
+            body    = content[start:end]
+            fields  = self._parse_fields(body)
+            node_id = id_prefix + struct_name
+            
+            node = Node(
+                id        = node_id,
+                name      = struct_name,
+                node_type = NodeType.STRUCT,
+                file_path = file_path,
+                is_public = is_public,
+                fields    = fields,
+                full_path = node_id
+            )
 
-    /* Tooltip container */
-    .node-tooltip {
-        position:      absolute;
-        display:       none;
-        z-index:       10000;
-        pointer-events: none;
-        max-height:    80vh;
-        overflow-y:    auto;
-    }
+            links = []
+            add   = links.append
+            for field in fields:
+                if field.is_fn_pointer:
+                    fn_refs = self._extract_fn_references_from_signature(field.fn_pointer_sig)
+                    for fn_ref in fn_refs:
+                        clean_ref = _clean_type_name(fn_ref)
+                        if not self.is_std_type(clean_ref):
+                            add(sys.intern(f"{field.name}::{clean_ref}"))
+                else:
+                    self._collect_linked(add, field.type_name)
 
-    .node-content {
-        background:    linear-gradient(145deg, #1e293b 0%, #0f172a 100%);
-        border:        2px solid #334155;
-        border-radius: 12px;
-        padding:       0;
-        min-width:     300px;
-        max-width:     450px;
-        box-shadow:    0 8px 32px rgba(0, 0, 0, 0.8);
-        overflow:      hidden;
-    }
+            node.linked_types.update(links)
 
-    .node-header {
-        padding:       16px;
-        background:    rgba(0, 0, 0, 0.3);
-        border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        display:       flex;
-        align-items:   center;
-        gap:           12px;
-    }
+            self.nodes[node_id] = node
+            
+            # Parse impl blocks and track function references
+            self._parse_impl_blocks(content, struct_name, node, impl_index, file_path, module_path)
 
-    .node-type-badge {
-        background:     rgba(96, 165, 250, 0.2);
-        color:          #60a5fa;
-        padding:        4px 10px;
-        border-radius:  6px;
-        font-size:      10px;
-        font-weight:    700;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        border:         1px solid rgba(96, 165, 250, 0.3);
-    }
+    def _index_impl_blocks(self, content: bytes,
+                           brace_pairs: Dict[int, int]) -> Dict[str, List[Tuple[int, int]]]:
+        """Scan inherent impl blocks once, bucketing body bounds by target type name"""
+        impl_index: Dict[str, List[Tuple[int, int]]] = {}
+        
+        for match in _RE_IMPL_TYPE.finditer(content):
+            start = match.end()
+            end   = brace_pairs.get(start - 1, start)
+            
+            impl_index.setdefault(_decode(match.group(1)), []).append((start, end))
+        
+        return impl_index
+
+    def _parse_fields(self, body: bytes) -> List[Field]:
+        """Parse struct fields by walking the body's tokens once"""
+        fields = []
+        depth  = 0
+        
+        # State of the field being read; name is set once its ':' is seen
+        name       = None
+        candidate  = None
+        is_public  = False
+        is_fn_ptr  = False
+        type_start = type_end = 0
+        
+        for token in _RE_FIELD_TOKEN.finditer(body):
+            kind = token.lastgroup
+            text = token.group()
+            if kind == 'skip':
+                continue
+            
+            if text in _FIELD_OPENERS:
+                depth += 1
+            elif text in _FIELD_CLOSERS:
+                depth = max(depth - 1, 0)
+            elif text == b',' and depth == 0:
+                # Only commas outside brackets end a field
+                if name is not None:
+                    fields.append(self._make_field(name, body[type_start:type_end],
+                                                   is_public, is_fn_ptr))
+                name      = candidate = None
+                is_public = is_fn_ptr = False
+                continue
+            
+            if name is not None:
+                type_end = token.end()
+                if text in _FN_TOKENS:
+                    is_fn_ptr = True
+            elif depth == 0:
+                # Attributes and pub(...) restrictions sit inside brackets
+                if text == b'pub':
+                    is_public = True
+                elif text == b':':
+                    if candidate is not None:
+                        name       = candidate
+                        type_start = type_end = token.end()
+                elif kind == 'word':
+                    candidate = text
+        
+        if name is not None:
+            fields.append(self._make_field(name, body[type_start:type_end],
+                                           is_public, is_fn_ptr))
+        
+        return fields
 
-    .node-title {
-        font-size:   18px;
-        font-weight: 700;
-        color:       #f1f5f9;
-        flex:        1;
-    }
+    def _make_field(self, name: bytes, type_name: bytes, is_public: bool, is_fn_ptr: bool) -> Field:
+        """Build a parsed struct field"""
+        type_name = _decode(type_name).strip()
+        
+        return Field(
+            name           = _decode(name),
+            type_name      = type_name,
+            is_public      = is_public,
+            is_fn_pointer  = is_fn_ptr,
+            fn_pointer_sig = type_name if is_fn_ptr else ""
+        )
 
-    .return-type-badge {
-        background:    rgba(168, 85, 247, 0.15);
-        color:         #a855f7;
-        padding:       8px 12px;
-        border-radius: 6px;
-        font-size:     12px;
-        margin:        12px 16px;
-        display:       inline-block;
-        font-family:   'Courier New', monospace;
-        border:        1px solid rgba(168, 85, 247, 0.3);
-    }
+    def _parse_impl_blocks(self, content: bytes, struct_name: str, node: Node,
+                          impl_index: Dict[str, List[Tuple[int, int]]],
+                          file_path: str, module_path: str):
+        """Parse impl blocks for methods and function references"""
+        # Method links from every block go in before any fn-path reference,
+        # keeping the insertion order of the two separate walks this replaced
+        method_links = []
+        links        = []
+        add          = links.append
+        
+        for start, end in impl_index.get(struct_name, []):
+            impl_body = content[start:end]
+            methods   = self._parse_methods(impl_body)
+            
+            node.methods.extend(methods)
+            
+            # Track linked types from methods
+            for method in methods:
+                method_links.extend(method.linked_types)
+            
+            # Look for function path references like def_fns::update::default
+            for fn_match in _RE_FN_REF.finditer(impl_body):
+                full_path = _decode(fn_match.group(0))
+                parts     = full_path.split('::')
+                
+                # Skip if it's just two parts (might be a type)
+                if len(parts) >= 2:
+                    # Add the path and the function name so either gets tracked
+                    add(sys.intern(full_path))
+                    add(sys.intern(parts[-1]))
+        
+        node.linked_types.update(method_links)
+        node.linked_types.update(links)
 
-    .return-type-badge .label {
-        opacity:        0.7;
-        font-size:      10px;
-        margin-right:   6px;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
+    def _parse_methods(self, impl_body: bytes) -> List[Method]:
+        """Parse methods from impl block"""
+        methods = [];
+        # The method pattern doesn't require an immediate { or ; after the
+        # signature, which allows for whitespace and complex bodies
+        for match in _RE_METHOD.finditer(impl_body):
+            method_name = _decode(match.group(2));
+            params_str  = _decode(match.group(3));
+            return_type = _decode(match.group(4)).strip() if match.group(4) else "";
+            is_public   = match.group(1) is not None;
+            
+            params = self._parse_params(params_str);
+            
+            methods.append(Method(
+                name         = method_name,
+                params       = params,
+                return_type  = return_type,
+                is_public    = is_public,
+                linked_types = self._method_linked_types(params, return_type)
+            ));
+        
+        return methods;
 
-    .section-wrapper {
-        border-bottom: 1px solid rgba(255, 255, 255, 0.05);
-    }
+    def _method_linked_types(self, params: List[Field], return_type: str) -> List[str]:
+        """Collect the non-std types a method's parameters and return type refer to"""
+        linked_types = []
+        add          = linked_types.append
+        
+        for param in params:
+            self._collect_linked(add, param.type_name)
+        
+        if return_type:
+            self._collect_linked(add, return_type)
+        
+        return linked_types
 
-    .section-wrapper:last-of-type {
-        border-bottom: none;
-    }
+    def _collect_linked(self, add: Callable[[str], None], type_name: str):
+        """Pass a type and the types in its generics to add, skipping std types"""
+        clean_type = _clean_type_name(type_name)
+        if not _is_std_type(clean_type):
+            add(sys.intern(clean_type))
+        
+        if '<' in type_name:
+            for inner in _extract_inner_types(type_name):
+                clean_inner = _clean_type_name(inner)
+                if not _is_std_type(clean_inner):
+                    add(sys.intern(clean_inner))
 
-    .section-header {
-        padding:        12px 16px;
-        background:     rgba(0, 0, 0, 0.2);
-        font-size:      11px;
-        font-weight:    700;
-        text-transform: uppercase;
-        letter-spacing: 1.5px;
-        color:          #94a3b8;
-    }
+    def _parse_params(self, params_str: str) -> List[Field]:
+        """Parse function parameters"""
+        params = []
+        
+        if not params_str.strip():
+            return params
+        
+        # Split by comma but respect nested generics
+        param_parts = _split_top_level_commas(params_str)
+        
+        for param in param_parts:
+            param = param.strip()
+            
+            # Skip self parameters
+            if param in ['self', '&self', '&mut self', 'mut self']:
+                continue
+            
+            # Parse "name: type" pattern
+            if ':' in param:
+                parts      = param.split(':', 1)
+                param_name = parts[0].strip()
+                type_name  = parts[1].strip()
+                
+                params.append(Field(
+                    name      = param_name,
+                    type_name = type_name,
+                    is_public = True
+                ))
+        
+        return params
 
-    .params-list, .fields-preview, .methods-preview, .variants-list, .dependents-list {
-        padding: 12px 16px;
-    }
+    def _parse_enums(self, content: bytes, definitions: Dict[str, List[re.Match]],
+                     file_path: str, module_path: str,
+                     brace_pairs: Dict[int, int]):
+        """Parse enum definitions"""
+        id_prefix = module_path + '::'
+        
+        for match in definitions['enum']:
+            enum_name = _decode(match.group(2))
+            is_public = match.group(1) is not None
+            
+            start = match.end()
+            end   = brace_pairs.get(start - 1, start)
+            
+            body     = content[start:end]
+            variants = self._parse_enum_variants(body)
+            node_id  = id_prefix + enum_name
+            
+            node = Node(
+                id        = node_id,
+                name      = enum_name,
+                node_type = NodeType.ENUM,
+                file_path = file_path,
+                is_public = is_public,
+                variants  = variants,
+                full_path = node_id
+            )
+            
+            # Track linked types from variants
+            links = []
+            add   = links.append
+            for variant in variants:
+                for field in variant.fields:
+                    self._collect_linked(add, field.type_name)
+            
+            node.linked_types.update(links)
+            
+            self.nodes[node_id] = node
 
-    .param-item, .field-item, .method-item, .variant-item, .dependent-item {
-        padding:       8px 12px;
-        margin-bottom: 6px;
-        background:    rgba(255, 255, 255, 0.03);
-        border-radius: 6px;
-        font-family:   'Courier New', monospace;
-        font-size:     12px;
-        line-height:   1.6;
-        transition:    all 0.2s ease;
-        border-left:   3px solid transparent;
-    }
+    def _create_method_function_nodes(self):
+        """Create separate function nodes for all methods in structs/enums/traits"""
+        new_nodes = {}
+        
+        owner_ids = [node_id for node_id, node_type in zip(self._node_ids, self._node_types)
+                     if node_type in _METHOD_OWNER_TYPES]
+        
+        for node in map(self.nodes.__getitem__, owner_ids):
+            for method in node.methods:
+                # Create a unique function node for this method
+                fn_node_id = f"{node.full_path}::fn::{method.name}"
+                
+                fn_node = Node(
+                    id          = fn_node_id,
+                    name        = f"{node.name}::{method.name}",
+                    node_type   = NodeType.FUNCTION,
+                    file_path   = node.file_path,
+                    is_public   = method.is_public,
+                    params      = method.params,
+                    return_type = method.return_type,
+                    full_path   = fn_node_id
+                )
+                
+                # Linked types were worked out once when the method was parsed
+                fn_node.linked_types.update(method.linked_types)
+                
+                new_nodes[fn_node_id] = fn_node
+        
+        # Add all new function nodes to the main nodes dict
+        for fn_node in new_nodes.values():
+            self._register(fn_node)
 
-    .param-item:hover, .field-item:hover, .method-item:hover, .variant-item:hover, .dependent-item:hover {
-        background:  rgba(255, 255, 255, 0.06);
-        border-left: 3px solid #60a5fa;
-    }
+    def _parse_trait_impls(self, content: bytes, definitions: Dict[str, List[re.Match]],
+                           brace_pairs: Dict[int, int]) -> List[TraitImpl]:
+        """Parse trait implementations (impl Trait for Type)"""
+        trait_impls = []
+        
+        for match in definitions['trait_impl']:
+            trait_name = _decode(match.group(1)).strip();
+            type_name  = _decode(match.group(2)).strip();
+            
+            start = match.end();
+            end   = brace_pairs.get(start - 1, start);
+            
+            impl_body = content[start:end];
+            methods   = self._parse_methods(impl_body);  # This already parses all methods correctly
+            
+            trait_impls.append(TraitImpl(
+                trait_name = trait_name,
+                type_name  = type_name,
+                methods    = methods
+            ));
+        
+        return trait_impls;
 
-    .param-item:last-child, .field-item:last-child, .method-item:last-child, 
-    .variant-item:last-child, .dependent-item:last-child {
-        margin-bottom: 0;
-    }
+    def _resolve_trait_impl(self, trait_impl: TraitImpl, file_path: str, module_path: str):
+        """Attach a trait impl to its target type, or record it as its own node"""
+        trait_name = trait_impl.trait_name;
+        type_name  = trait_impl.type_name;
+        methods    = trait_impl.methods;
+        
+        # Find the target type node and add methods to it
+        target_node = self._find_node_by_type(type_name);
+        if target_node:
+            # Add all methods from trait impl to the target node
+            # Mark that these methods are from a trait impl
+            for method in methods:
+                method.is_public = True;  # Trait methods are always public
+            target_node.methods.extend(methods);
+            
+            # Track the trait as a linked type
+            clean_trait = _clean_type_name(trait_name);
+            if not self.is_std_type(clean_trait):
+                target_node.linked_types.add(sys.intern(clean_trait));
+                
+            # Track linked types from methods
+            for method in methods:
+                target_node.linked_types.update(method.linked_types);
+        else:
+            # Create trait impl node only if target type not found
+            node_id = f"{module_path}::impl_{trait_name}_for_{type_name}";
+            
+            node = Node(
+                id         = node_id,
+                name       = f"{trait_name} for {type_name}",
+                node_type  = NodeType.TRAIT_IMPL,
+                file_path  = file_path,
+                is_public  = True,
+                methods    = methods,
+                impl_trait = trait_name,
+                impl_for   = type_name,
+                full_path  = node_id
+            );
+            
+            # Track linked types...
+            clean_trait = _clean_type_name(trait_name);
+            clean_type  = _clean_type_name(type_name);
+            
+            if not self.is_std_type(clean_trait):
+                node.linked_types.add(sys.intern(clean_trait));
+            if not self.is_std_type(clean_type):
+                node.linked_types.add(sys.intern(clean_type));
+            
+            # Track linked types from methods
+            for method in methods:
+                node.linked_types.update(method.linked_types);
+            
+            self._register(node);
 
-    .param-name, .field-name, .method-name, .variant-name, .dependent-name {
-        color:       #38bdf8;
-        font-weight: 600;
-    }
 
-    .param-sep, .field-sep {
-        color:  #64748b;
-        margin: 0 6px;
-    }
+    def _parse_trait_methods(self, trait_body: bytes) -> List[TraitMethod]:
+        """Parse methods from trait definition"""
+        methods = []
+        
+        for match in _RE_TRAIT_METHOD.finditer(trait_body):
+            method_name = _decode(match.group(1))
+            params_str  = _decode(match.group(2))
+            return_type = _decode(match.group(3)).strip() if match.group(3) else ""
+            
+            # Check if method has default implementation
+            after_sig = trait_body[match.end():].lstrip()
+            has_default = after_sig.startswith(b'{')
+            
+            params = self._parse_params(params_str)
+            
+            methods.append(TraitMethod(
+                name        = method_name,
+                params      = params,
+                return_type = return_type,
+                has_default = has_default
+            ))
+        
+        return methods
 
-    .param-type, .field-type {
-        color: #a78bfa;
-    }
+    def _parse_traits(self, content: bytes, definitions: Dict[str, List[re.Match]],
+                      file_path: str, module_path: str,
+                      brace_pairs: Dict[int, int]):
+        """Parse trait definitions"""
+        id_prefix = module_path + '::'
+        
+        for match in definitions['trait']:
+            trait_name = _decode(match.group(2))
+            bounds     = _decode(match.group(3)).strip() if match.group(3) else ""
+            is_public  = match.group(1) is not None
+            
+            start = match.end()
+            end   = brace_pairs.get(start - 1, start)
+            
+            body     = content[start:end]
+            methods  = self._parse_trait_methods(body)
+            node_id  = id_prefix + trait_name
+            
+            node = Node(
+                id            = node_id,
+                name          = trait_name,
+                node_type     = NodeType.TRAIT,
+                file_path     = file_path,
+                is_public     = is_public,
+                trait_methods = methods,
+                full_path     = node_id
+            )
+            
+            # Track linked types from trait bounds
+            links = []
+            add   = links.append
+            if bounds:
+                for bound in bounds.split('+'):
+                    clean_bound = _clean_type_name(bound.strip())
+                    if not self.is_std_type(clean_bound):
+                        add(sys.intern(clean_bound))
+            
+            # Track linked types from methods
+            for method in methods:
+                for param in method.params:
+                    self._collect_linked(add, param.type_name)
+                
+                if method.return_type:
+                    self._collect_linked(add, method.return_type)
+            
+            node.linked_types.update(links)
+            
+            self.nodes[node_id] = node
 
-    .method-params {
-        color:       #94a3b8;
-        margin-left: 4px;
-    }
+    def _parse_enum_variants(self, body: bytes) -> List[EnumVariant]:
+        """Parse enum variants"""
+        variants = []
+        
+        # Each top-level part is one variant: attributes, a name, an optional
+        # tuple or struct body and an optional discriminant
+        for part in _split_variants(body):
+            match = _RE_VARIANT.fullmatch(part)
+            if not match:
+                continue
+            
+            variant_name  = _decode(match.group(1))
+            tuple_fields  = match.group(2)
+            struct_fields = match.group(3)
+            
+            fields = []
+            
+            if tuple_fields:
+                field_types = _split_top_level_commas(_decode(tuple_fields))
+                for i, type_name in enumerate(field_types):
+                    fields.append(Field(
+                        name      = f"field_{i}",
+                        type_name = type_name,
+                        is_public = True
+                    ))
+            elif struct_fields:
+                fields = self._parse_fields(struct_fields)
+            
+            variants.append(EnumVariant(
+                name   = variant_name,
+                fields = fields
+            ))
+        
+        return variants
 
-    .method-return {
-        color:       #10b981;
-        margin-left: 8px;
-    }
+    def _parse_functions(self, content: bytes, file_path: str, module_path: str,
+                         brace_pairs: Dict[int, int]):
+        """Parse standalone functions"""
+        # Skip matches inside impl blocks so their methods aren't parsed as standalone functions
+        impl_starts, impl_ends = self._impl_spans(content, brace_pairs)
+        id_prefix              = module_path + '::'
+
+        for match in _RE_FN.finditer(content):
+            pos = match.start()
+            i   = bisect_right(impl_starts, pos) - 1
+            if i >= 0 and pos < impl_ends[i]:
+                continue
 
-    .variant-fields {
-        color:       #94a3b8;
-        margin-left: 4px;
-    }
+            fn_name     = _decode(match.group(2))
+            params_str  = _decode(match.group(3))
+            return_type = _decode(match.group(4)).strip() if match.group(4) else ""
+            is_public   = match.group(1) is not None
 
-    .visibility {
-        background:     rgba(16, 185, 129, 0.2);
-        color:          #10b981;
-        padding:        2px 6px;
-        border-radius:  4px;
-        font-size:      10px;
-        font-weight:    700;
-        margin-right:   8px;
-        text-transform: uppercase;
-    }
+            params  = self._parse_params(params_str)
+            node_id = id_prefix + fn_name
 
-    .visibility.private {
-        background: rgba(248, 113, 113, 0.2);
-        color:      #f87171;
-    }
+            node = Node(
+                id          = node_id,
+                name        = fn_name,
+                node_type   = NodeType.FUNCTION,
+                file_path   = file_path,
+                is_public   = is_public,
+                params      = params,
+                return_type = return_type,
+                full_path   = node_id
+            )
 
-    .fn-pointer-badge {
-        background:     rgba(245, 158, 11, 0.2);
-        color:          #f59e0b;
-        padding:        2px 6px;
-        border-radius:  4px;
-        font-size:      9px;
-        font-weight:    700;
-        margin-right:   8px;
-        text-transform: uppercase;
-        border:         1px solid rgba(245, 158, 11, 0.3);
-    }
+            # Track linked types
+            links = []
+            add   = links.append
+            for param in params:
+                self._collect_linked(add, param.type_name)
 
-    .default-badge {
-        background:     rgba(139, 92, 246, 0.2);
-        color:          #8b5cf6;
-        padding:        2px 6px;
-        border-radius:  4px;
-        font-size:      9px;
-        font-weight:    700;
-        margin-right:   8px;
-        text-transform: uppercase;
-        border:         1px solid rgba(139, 92, 246, 0.3);
-    }
+            if return_type:
+                self._collect_linked(add, return_type)
 
-    .dep-type-badge {
-        background:     rgba(236, 72, 153, 0.2);
-        color:          #ec4899;
-        padding:        2px 6px;
-        border-radius:  4px;
-        font-size:      9px;
-        font-weight:    700;
-        text-transform: uppercase;
-        border:         1px solid rgba(236, 72, 153, 0.3);
-        margin-right:   8px;
-    }
+            node.linked_types.update(links)
 
-    .dep-type-badge.struct   { background: rgba(16, 185, 129, 0.2); color: #10b981; border: 1px solid rgba(16, 185, 129, 0.3); }
-    .dep-type-badge.function { background: rgba(245, 158, 11, 0.2); color: #f59e0b; border: 1px solid rgba(245, 158, 11, 0.3); }
-    .dep-type-badge.enum     { background: rgba(239, 68, 68, 0.2);  color: #ef4444; border: 1px solid rgba(239, 68, 68, 0.3); }
-    .dep-type-badge.trait    { background: rgba(139, 92, 246, 0.2); color: #8b5cf6; border: 1px solid rgba(139, 92, 246, 0.3); }
+            self.nodes[node_id] = node
 
-    .file-info {
-        padding:     12px 16px;
-        background:  rgba(0, 0, 0, 0.3);
-        font-size:   11px;
-        color:       #64748b;
-        font-style:  italic;
-        display:     flex;
-        align-items: center;
-        gap:         8px;
-    }
+    def _parse_constants(self, content: bytes, definitions: Dict[str, List[re.Match]],
+                         file_path: str, module_path: str):
+        """Parse constants"""
+        id_prefix = module_path + '::'
+        
+        for match in definitions['const']:
+            const_name = _decode(match.group(2))
+            const_type = _decode(match.group(3)).strip()
+            is_public  = match.group(1) is not None
+            node_id    = id_prefix + const_name
+            
+            node = Node(
+                id          = node_id,
+                name        = const_name,
+                node_type   = NodeType.CONST,
+                file_path   = file_path,
+                is_public   = is_public,
+                return_type = const_type,  # Store type in return_type field
+                full_path   = node_id
+            )
+            
+            # Track the const type
+            self._collect_linked(node.linked_types.add, const_type)
+            
+            self.nodes[node_id] = node
 
-    .file-icon {
-        font-size: 14px;
-    }
+    def _parse_type_aliases(self, content: bytes, definitions: Dict[str, List[re.Match]],
+                            file_path: str, module_path: str):
+        """Parse type aliases"""
+        id_prefix = module_path + '::'
+        
+        for match in definitions['type_alias']:
+            alias_name  = _decode(match.group(2))
+            target_type = _decode(match.group(3)).strip()
+            is_public   = match.group(1) is not None
+            node_id     = id_prefix + alias_name
+            
+            node = Node(
+                id          = node_id,
+                name        = alias_name,
+                node_type   = NodeType.TYPE_ALIAS,
+                file_path   = file_path,
+                is_public   = is_public,
+                return_type = target_type,  # Store target type in return_type field
+                full_path   = node_id
+            )
+            
+            # Track the target type
+            self._collect_linked(node.linked_types.add, target_type)
+            
+            self.nodes[node_id] = node
 
-    .dependent-item.more {
-        opacity:    0.6;
-        font-style: italic;
-        color:      #94a3b8;
-    }
+    def _impl_spans(self, content: bytes, brace_pairs: Dict[int, int]) -> Tuple[List[int], List[int]]:
+        """Find the byte range of every top-level impl block, as sorted starts and ends"""
+        starts   = []
+        ends     = []
+        last_end = 0
+        
+        for match in _RE_IMPL_BLOCK.finditer(content):
+            # Impls nested in an impl already being skipped are covered by it
+            if match.start() < last_end:
+                continue
+            
+            close = brace_pairs.get(match.end() - 1)
+            if close is not None:
+                starts.append(match.start())
+                ends.append(close + 1)
+                last_end = close + 1
+        
+        return starts, ends
 
-    /* Scrollbar for tooltip */
-    .node-tooltip::-webkit-scrollbar {
-        width: 8px;
-    }
+    def _mark_usage(self):
+        """Mark which nodes are used by others"""
+        # Mark all public items as potentially used (they might be called from outside)
+        for node in self.nodes.values():
+            if node.is_public:
+                node.is_used = True;
+        
+        # Mark items that are referenced internally. Only whether a name is
+        # referenced matters, so each distinct name is resolved once
+        find_node = self._find_node_by_type
+        for linked_type in set().union(*[node.linked_types for node in self.nodes.values()]):
+            target_node = find_node(linked_type);
+            if target_node:
+                target_node.is_used = True;
 
-    .node-tooltip::-webkit-scrollbar-track {
-        background:    rgba(0, 0, 0, 0.3);
-        border-radius: 4px;
-    }
+    def _build_tree_structure(self) -> List[Dict]:
+        """Build tree structure with parent-child relationships using resolved paths"""
+        # First pass: build children relationships
+        for node in self.nodes.values():
+            for linked_type in node.linked_types:
+                target_node = self._find_node_by_type(linked_type)
+                if target_node and target_node not in node.children:
+                    node.children.append(target_node)
+                    # Also track reverse relationship (dependents)
+                    if node not in target_node.dependents:
+                        target_node.dependents.append(node)
+        
+        # Find root nodes (nodes not used as children)
+        all_children = set()
+        for node in self.nodes.values():
+            for child in node.children:
+                all_children.add(child.id)
+        
+        root_nodes = [node for node in self.nodes.values() if node.id not in all_children]
+        
+        return root_nodes
 
-    .node-tooltip::-webkit-scrollbar-thumb {
-        background:    rgba(96, 165, 250, 0.3);
-        border-radius: 4px;
-    }
+    def generate_output(self, output_dir: str = "output", compress: bool = False):
+        """Generate visualization files"""
+        output_path = Path(output_dir)
+        output_path.mkdir(exist_ok=True)
+        
+        # The stylesheet is static, so it is written on a background thread
+        # while the graph data is built and serialized
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            css_written = executor.submit(self._generate_css, output_path)
+            
+            # Build graph data
+            graph_data = self._build_graph_data()
+            
+            # Generate HTML with embedded data
+            self._generate_html(output_path, graph_data)
+            
+            css_written.result()
+        
+        if compress:
+            self._compress_output(output_path)
+        
+        print(f"\nVisualization generated in '{output_dir}/' directory")
+        print(f"Open '{output_dir}/index.html' in your browser")
 
-    .node-tooltip::-webkit-scrollbar-thumb:hover {
-        background: rgba(96, 165, 250, 0.5);
-    }
+    def _compress_output(self, output_path: Path):
+        """Write gzip copies of the generated files for servers that send them precompressed"""
+        for name in ("index.html", "styles.css"):
+            source_path = output_path / name
+            gz_path     = output_path / f"{name}.gz"
+            
+            # A copy written after its source last changed is still current; equal
+            # stamps on coarse-grained filesystems are recompressed to be safe
+            try:
+                if gz_path.stat().st_mtime_ns > source_path.stat().st_mtime_ns:
+                    continue
+            except OSError:
+                pass
+            
+            gz_path.write_bytes(gzip.compress(source_path.read_bytes(), compresslevel=6, mtime=0))
 
-    .legend {
-        padding:       12px 20px;
-        background:    rgba(0, 0, 0, 0.5);
-        border-bottom: 1px solid rgba(96, 165, 250, 0.2);
-        display:       flex;
-        align-items:   center;
-        gap:           20px;
-    }
+    def _build_graph_data(self) -> Dict:
+        """Build data structure for Cytoscape.js graph"""
+        added_edges = set()
+        add_edge    = added_edges.add
+        
+        # Add all nodes, whose ids are already unique as keys of self.nodes.
+        # Types come from the parser's type column, in the same order
+        elements = [
+            {
+                'data': {
+                    'id':        node.id,
+                    'label':     node.name,
+                    'type':      _NODE_TYPE_LABELS[node_type],
+                    'is_used':   node.is_used,
+                    'html':      ''.join(self._build_node_html(node)),
+                    'file_path': node.file_path
+                },
+                'classes': _NODE_CLASSES[node_type, node.is_used]
+            }
+            for node, node_type in zip(self.nodes.values(), self._node_types)
+        ]
+        
+        # Add every node's outgoing edges in one pass, by node type
+        for node in self.nodes.values():
+            node_type = node.node_type
+            
+            # Edges for type dependencies (struct/enum/trait -> other types they use)
+            if node_type in _USES_EDGE_SOURCES:
+                for linked_type in node.linked_types:
+                    target_node = self._find_node_by_type(linked_type)
+                    if target_node and target_node.node_type in _USES_EDGE_TARGETS:
+                        edge_id = f"{node.id}-uses->{target_node.id}"
+                        if edge_id not in added_edges:
+                            add_edge(edge_id)
+                            elements.append({
+                                'data': {
+                                    'id':        edge_id,
+                                    'source':    node.id,
+                                    'target':    target_node.id,
+                                    'edgeType':  'uses'
+                                },
+                                'classes': 'edge-uses'
+                            })
+            
+            # Edges for method implementations (struct/enum/trait -> method functions)
+            if node_type in _METHOD_OWNER_TYPES:
+                for method in node.methods:
+                    # Find the corresponding function node we created
+                    fn_node_id = f"{node.full_path}::fn::{method.name}"
+                    if fn_node_id in self.nodes:
+                        edge_id = f"{node.id}-has_method->{fn_node_id}"
+                        if edge_id not in added_edges:
+                            add_edge(edge_id)
+                            elements.append({
+                                'data': {
+                                    'id':        edge_id,
+                                    'source':    node.id,
+                                    'target':    fn_node_id,
+                                    'edgeType':  'has_method',
+                                    'label':     'method'
+                                },
+                                'classes': 'edge-has-method'
+                            })
+            
+            # Edges from functions to types they use (function params/returns -> types)
+            if node_type == NodeType.FUNCTION:
+                for linked_type in node.linked_types:
+                    target_node = self._find_node_by_type(linked_type)
+                    if target_node and target_node.node_type in _FN_USES_TARGETS:
+                        edge_id = f"{node.id}-uses->{target_node.id}"
+                        if edge_id not in added_edges:
+                            add_edge(edge_id)
+                            elements.append({
+                                'data': {
+                                    'id':        edge_id,
+                                    'source':    node.id,
+                                    'target':    target_node.id,
+                                    'edgeType':  'fn_uses_type'
+                                },
+                                'classes': 'edge-fn-uses-type'
+                            })
+            
+            # Edges for function pointers in struct fields
+            if node_type in _FIELD_OWNER_TYPES:
+                for field in node.fields:
+                    if field.is_fn_pointer:
+                        # Extract function references from the signature
+                        fn_refs = self._extract_fn_references_from_signature(field.fn_pointer_sig)
+                        for fn_ref in fn_refs:
+                            fn_node = self._find_node_by_type(fn_ref)
+                            if fn_node and fn_node.node_type == NodeType.FUNCTION:
+                                edge_id = f"{node.id}-fn_ptr:{field.name}->{fn_node.id}"
+                                if edge_id not in added_edges:
+                                    add_edge(edge_id)
+                                    elements.append({
+                                        'data': {
+                                            'id':        edge_id,
+                                            'source':    node.id,
+                                            'target':    fn_node.id,
+                                            'edgeType':  'fn_pointer',
+                                            'label':     f'fn_ptr: {field.name}'
+                                        },
+                                        'classes': 'edge-fn-pointer'
+                                    })
+            
+            # Edges for trait implementations
+            if node_type == NodeType.TRAIT_IMPL:
+                # Connect trait impl to the trait
+                if node.impl_trait:
+                    trait_node = self._find_node_by_type(node.impl_trait)
+                    if trait_node:
+                        edge_id = f"{node.id}-impl_trait->{trait_node.id}"
+                        if edge_id not in added_edges:
+                            add_edge(edge_id)
+                            elements.append({
+                                'data': {
+                                    'id':        edge_id,
+                                    'source':    node.id,
+                                    'target':    trait_node.id,
+                                    'edgeType':  'impl_trait',
+                                    'label':     'implements'
+                                },
+                                'classes': 'edge-impl-trait'
+                            })
+                
+                # Connect type to trait impl
+                if node.impl_for:
+                    type_node = self._find_node_by_type(node.impl_for)
+                    if type_node:
+                        edge_id = f"{type_node.id}-has_impl->{node.id}"
+                        if edge_id not in added_edges:
+                            add_edge(edge_id)
+                            elements.append({
+                                'data': {
+                                    'id':        edge_id,
+                                    'source':    type_node.id,
+                                    'target':    node.id,
+                                    'edgeType':  'has_trait_impl',
+                                    'label':     'impl for'
+                                },
+                                'classes': 'edge-has-trait-impl'
+                            })
+        
+        return {
+            'elements': elements,
+            'style':    self._build_cytoscape_style()
+        }
 
-    .legend-title {
-        font-size:   12px;
-        font-weight: 700;
-        color:       #94a3b8;
-    }
+    def _find_method_function(self, parent_node: Node, method: Method) -> Optional[Node]:
+        """
+        Try to find a standalone function node that might correspond to this method.
+        This is a heuristic - looks for functions with matching names in related modules.
+        """
+        # Look for functions with matching name
+        method_path = f"{parent_node.full_path.rsplit('::', 1)[0]}::{method.name}"
+        
+        for node in self.nodes.values():
+            if node.node_type == NodeType.FUNCTION:
+                if node.full_path == method_path or node.name == method.name:
+                    # Verify signature similarity
+                    if len(node.params) == len(method.params):
+                        return node
+        
+        return None
 
-    .legend-items {
-        display:    flex;
-        gap:        16px;
-        flex-wrap:  wrap;
-    }
+    def _build_node_html(self, node: Node) -> List[str]:
+        """Build HTML content for a node (extracted for reuse)"""
+        html_parts = [_NODE_HEADER_HTML.format(type=_NODE_TYPE_LABELS[node.node_type], name=_escape(node.name))]
+        append     = html_parts.append
+        extend     = html_parts.extend
+        
+        if node.return_type:
+            append(_RETURN_TYPE_HTML.format(return_type=_escape(node.return_type)))
+        
+        # Parameters
+        if node.params:
+            append(_PARAMS_SECTION_HTML)
+            extend([
+                _PARAM_HTML.format(name=_escape(param.name), type_name=_escape(param.type_name))
+                for param in node.params
+            ])
+            append(_SECTION_END_HTML)
+        
+        # Fields
+        if node.fields:
+            append(_FIELDS_SECTION_HTML)
+            extend([
+                _FIELD_HTML.format(
+                    vis       = _PUB_HTML if field.is_public else _PRIV_HTML,
+                    fn_badge  = _FN_POINTER_HTML if field.is_fn_pointer else '',
+                    name      = _escape(field.name),
+                    type_name = _escape(field.type_name)
+                )
+                for field in node.fields
+            ])
+            append(_SECTION_END_HTML)
+        
+        # Methods
+        if node.methods:
+            append(_METHODS_SECTION_HTML)
+            extend([
+                _METHOD_HTML.format(
+                    badge  = _PUB_HTML if method.is_public else _PRIV_HTML,
+                    name   = _escape(method.name),
+                    params = _escape(_join_params(method.params)),
+                    ret    = f' → {_escape(method.return_type)}' if method.return_type else ''
+                )
+                for method in node.methods
+            ])
+            append(_SECTION_END_HTML)
+        
+        # Trait methods
+        if node.trait_methods:
+            append(_TRAIT_METHODS_SECTION_HTML)
+            extend([
+                _METHOD_HTML.format(
+                    badge  = _DEFAULT_HTML if method.has_default else '',
+                    name   = _escape(method.name),
+                    params = _escape(_join_params(method.params)),
+                    ret    = f' → {_escape(method.return_type)}' if method.return_type else ''
+                )
+                for method in node.trait_methods
+            ])
+            append(_SECTION_END_HTML)
+        
+        # Variants
+        if node.variants:
+            append(_VARIANTS_SECTION_HTML)
+            extend([
+                _VARIANT_FIELDS_HTML.format(
+                    name   = _escape(variant.name),
+                    fields = _escape(_join_field_types(variant.fields))
+                )
+                if variant.fields else _VARIANT_HTML.format(name=_escape(variant.name))
+                for variant in node.variants
+            ])
+            append(_SECTION_END_HTML)
+        
+        # Dependents
+        if node.dependents:
+            append(_DEPENDENTS_SECTION_HTML)
+            extend([
+                _DEPENDENT_HTML.format(type=_NODE_TYPE_LABELS[dependent.node_type], name=_escape(dependent.name))
+                for dependent in node.dependents[:10]
+            ])
+            if len(node.dependents) > 10:
+                append(f'<div class="dependent-item more">+ {len(node.dependents) - 10} more...</div>')
+            append(_SECTION_END_HTML)
+        
+        append(_FILE_INFO_HTML.format(file_path=_escape(node.file_path)))
+        
+        return html_parts
 
-    .legend-item {
-        display:     flex;
-        align-items: center;
-        gap:         8px;
-        font-size:   11px;
-        color:       #cbd5e1;
-    }
+    def _build_cytoscape_style(self) -> Tuple[Dict, ...]:
+        """Build Cytoscape.js style configuration"""
+        return _CYTOSCAPE_STYLE
 
-    .legend-line {
-        width:  30px;
-        height: 3px;
-    }
+    def _generate_html(self, output_path: Path, graph_data: Dict):
+        """Generate HTML file with Cytoscape.js visualization"""
+        # The graph data is only read by the page's script, so it is written
+        # compact; non-ASCII text is left unescaped and the page is UTF-8
+        if orjson is not None:
+            graph_json = orjson.dumps(graph_data)
+        else:
+            graph_json = json.dumps(graph_data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        
+        # Neither encoder escapes '</', which would let a string end the
+        # inline <script> early; '<\/' decodes to the same JSON string
+        graph_json = graph_json.replace(b'</', b'<\\/')
+        
+        # One large buffer turns the whole page into a handful of writes
+        with open(output_path / "index.html", 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(_INDEX_HTML_HEAD)
+            f.write(graph_json)
+            f.write(_INDEX_HTML_TAIL)
 
-    .edge-uses-line            { background: #60a5fa; }
-    .edge-has-method-line      { background: #10b981; }
-    .edge-fn-uses-type-line    { 
-        background:    transparent;
-        border-top:    2px dashed #fbbf24;
-        border-bottom: none;
-        height:        0;
-    }
-    .edge-fn-pointer-line      { 
-        background:    transparent;
-        border-top:    2px dotted #f59e0b;
-        border-bottom: none;
-        height:        0;
-    }
-    .edge-impl-trait-line      { background: #8b5cf6; }
-    .edge-has-trait-impl-line  { 
-        background:    transparent;
-        border-top:    2px dashed #ec4899;
-        border-bottom: none;
-        height:        0;
-    }
-    '''
+    def _generate_css(self, output_path: Path):
+        """Generate CSS file"""
+        css_path = output_path / "styles.css"
+        
+        # The stylesheet is the same on every run, so a current copy is left untouched
+        try:
+            if css_path.stat().st_size == len(_STYLES_CSS) and css_path.read_bytes() == _STYLES_CSS:
+                return
+        except OSError:
+            pass
         
-        with open(output_path / "styles.css", 'w') as f:
-            f.write(css_content)
+        css_path.write_bytes(_STYLES_CSS)
+
 
+def _file_digest(file_path: Path) -> Optional[bytes]:
+    """Hash a file's contents, or None if it can't be read"""
+    try:
+        with open(file_path, 'rb') as f:
+            return hashlib.blake2b(f.read()).digest()
+    except OSError:
+        return None
+
+def _find_rust_files(root: Path) -> List[Path]:
+    """
+    List the .rs files under root in rglob's order, never descending into a
+    target/ directory, where cargo keeps build output and generated sources.
+    """
+    rust_files = []
+    pending    = [str(root)]
+    
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != 'target':
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.rs') and entry.is_file():
+                    rust_files.append(Path(entry.path))
+            except OSError:
+                continue
+        
+        # Depth first, visiting subdirectories in the order they were listed
+        pending.extend(reversed(subdirs))
+    
+    return rust_files
+
+def _cache_dir() -> Path:
+    """Directory holding the parse caches, under $XDG_CACHE_HOME or ~/.cache"""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / _CACHE_DIRNAME
+
+def _cache_key(create: bool = False) -> bytes:
+    """Read this user's cache signing key, generating it on first use if asked"""
+    key_path = _cache_dir() / _CACHE_KEYNAME
+    try:
+        return key_path.read_bytes()
+    except FileNotFoundError:
+        if not create:
+            raise
+    
+    key = os.urandom(32)
+    try:
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        # Another run created it first
+        return key_path.read_bytes()
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
+
+def _parse_file_worker(file_path: Path, project_root: Path) -> Optional[ParsedFile]:
+    """Parse one file with a fresh parser so it can run in a worker process"""
+    return RustParser(project_root)._parse_file(file_path)
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    import argparse
+    
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got '{value}'")
+    return number
 
 def main():
     import argparse
@@ -2150,6 +2675,23 @@ def main():
         default='output',
         help='Output directory for generated files (default: output)'
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=_positive_int,
+        default=None,
+        help='Number of worker processes for parsing (default: all cores, 1 to disable)'
+    )
+    parser.add_argument(
+        '--compress',
+        action='store_true',
+        help='Also write gzip-compressed copies (index.html.gz, styles.css.gz) for serving'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=('Reparse every file instead of reusing the parse cache, which is kept '
+              f'per project under $XDG_CACHE_HOME/{_CACHE_DIRNAME} (default ~/.cache/{_CACHE_DIRNAME})')
+    )
     
     args = parser.parse_args()
     
@@ -2160,27 +2702,25 @@ def main():
     print(f"Scanning Rust project at: {args.project_path}")
     print("=" * 60)
     
-    parser_instance = RustParser(args.project_path)
+    parser_instance = RustParser(args.project_path, jobs=args.jobs,
+                                 use_cache=not args.no_cache)
     parser_instance.scan_project()
     
     print(f"\nFound {len(parser_instance.nodes)} items:")
     
-    type_counts = {}
-    for node in parser_instance.nodes.values():
-        node_type = node.node_type.value
-        type_counts[node_type] = type_counts.get(node_type, 0) + 1
+    type_counts = parser_instance.type_counts()
     
     for node_type, count in sorted(type_counts.items()):
         print(f"  - {node_type:10s}: {count}")
     
-    used_count   = sum(1 for n in parser_instance.nodes.values() if n.is_used)
+    used_count   = sum(map(attrgetter('is_used'), parser_instance.nodes.values()))
     unused_count = len(parser_instance.nodes) - used_count
     
     print(f"\nUsage statistics:")
     print(f"  - Used items:   {used_count}")
     print(f"  - Unused items: {unused_count}")
     
-    parser_instance.generate_output(args.output)
+    parser_instance.generate_output(args.output, compress=args.compress)
     
     return 0
 